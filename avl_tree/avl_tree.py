@@ -3,8 +3,9 @@ Node class to keep track of
 the data internal to individual nodes
 """
 class Node:
-    def __init__(self, key):
+    def __init__(self, key, value=None):
         self.key = key
+        self.value = value
         self.left = None
         self.right = None
 
@@ -18,14 +19,18 @@ class AVLTree:
         # init height to -1 because of 0-indexing
         self.height = -1
         self.balance = 0
+        # The number of keys in this tree
+        self.size = 0
+        if node is not None:
+            self._refresh()
 
     """
     Display the whole tree. Uses recursive def.
+    Heights and balance factors are kept current by every change
+    made through the tree's methods; call `update_height` first on
+    a tree whose nodes were linked up by hand.
     """
     def display(self, level=0, pref=''):
-        self.update_height()  # Update height before balancing
-        self.update_balance()
-
         if self.node != None: 
             print ('-' * level * 2, pref, self.node.key,
                    f'[{self.height}:{self.balance}]',
@@ -40,13 +45,35 @@ class AVLTree:
     in the tree
     """
     def update_height(self):
-        pass
+        if self.node is not None:
+            for child in (self.node.left, self.node.right):
+                if child is not None:
+                    child.update_height()
+        self._refresh()
 
     """
     Updates the balance factor on the AVLTree class
     """
     def update_balance(self):
-        pass
+        self.balance = _height(self.node.left) - _height(self.node.right) \
+            if self.node is not None else 0
+
+    """
+    Recomputes height, balance and size from the values stored in
+    the two child trees, in O(1). Everything that changes the shape
+    of the tree calls this bottom-up, so the stored values stay
+    current without walking the whole tree.
+    """
+    def _refresh(self):
+        if self.node is None:
+            self.height = -1
+            self.balance = 0
+            self.size = 0
+            return
+        left, right = self.node.left, self.node.right
+        self.height = 1 + max(_height(left), _height(right))
+        self.balance = _height(left) - _height(right)
+        self.size = 1 + _size(left) + _size(right)
 
     """
     Perform a left rotation, making the right child of this
@@ -54,7 +81,15 @@ class AVLTree:
     of the new parent. 
     """
     def left_rotate(self):
-        pass
+        old_root = self.node
+        pivot = old_root.right
+        # The pivot's tree object is reused to hold the old root.
+        self.node = pivot.node
+        old_root.right = self.node.left
+        pivot.node = old_root
+        self.node.left = pivot
+        pivot._refresh()
+        self._refresh()
 
     """
     Perform a right rotation, making the left child of this
@@ -62,7 +97,14 @@ class AVLTree:
     of the new parent. 
     """
     def right_rotate(self):
-        pass
+        old_root = self.node
+        pivot = old_root.left
+        self.node = pivot.node
+        old_root.left = self.node.right
+        pivot.node = old_root
+        self.node.right = pivot
+        pivot._refresh()
+        self._refresh()
 
     """
     Sets in motion the rebalancing logic to ensure the
@@ -70,12 +112,227 @@ class AVLTree:
     1 or -1
     """
     def rebalance(self):
-        pass
-        
+        self.update_height()
+        self._rebalance()
+
+    """
+    `rebalance` for a tree whose stored heights are already
+    current, as they are during insertion and deletion.
+    """
+    def _rebalance(self):
+        if self.balance > 1:
+            if self.node.left.balance < 0:
+                self.node.left.left_rotate()
+            self.right_rotate()
+        elif self.balance < -1:
+            if self.node.right.balance > 0:
+                self.node.right.right_rotate()
+            self.left_rotate()
+
+    """
+    Returns the path of trees from this one down to the one holding
+    `key`, or down to the empty spot where `key` would go. The last
+    tree on the path holds the key if `found` is True.
+    """
+    def _search(self, key):
+        path = [self]
+        tree = self
+        while tree.node is not None:
+            if key == tree.node.key:
+                return path, True
+            child = tree.node.left if key < tree.node.key \
+                else tree.node.right
+            if child is None:
+                break
+            tree = child
+            path.append(tree)
+        return path, False
+
+    """
+    Fixes up the path after a key was added (delta 1) or removed
+    (delta -1) at its end: every size on it changes, then heights
+    are refreshed and rebalanced deepest first until a subtree
+    comes out the same height as before, above which nothing else
+    can have changed. Rotations keep each tree object in place, so
+    the parents' links stay valid.
+    """
+    def _retrace(self, path, delta):
+        for tree in path:
+            tree.size += delta
+        for tree in reversed(path):
+            height = tree.height
+            tree._refresh()
+            tree._rebalance()
+            if tree.height == height:
+                break
+
     """
     Uses the same insertion logic as a binary search tree
     after the value is inserted, we need to check to see
     if we need to rebalance
+
+    The tree is an ordered map: `value` is stored with the key, and
+    inserting a key that is already present replaces its value.
+    Insertion walks down once, then retraces the search path, so
+    it is O(log n) with no recursion.
+    """
+    def insert(self, key, value=None):
+        path, found = self._search(key)
+        tree = path[-1]
+        if found:
+            tree.node.value = value
+            return
+        if tree.node is None:
+            tree.node = Node(key, value)
+        elif key < tree.node.key:
+            tree.node.left = AVLTree(Node(key, value))
+        else:
+            tree.node.right = AVLTree(Node(key, value))
+        self._retrace(path, 1)
+
+    """
+    Removes the key and returns its value. Raises KeyError if the
+    key isn't in the tree.
+    """
+    def delete(self, key):
+        path, found = self._search(key)
+        if not found:
+            raise KeyError(key)
+        target = path[-1].node
+        value = target.value
+        if target.left is not None and target.right is not None:
+            # Move the successor's entry up into the target node and
+            # remove the successor, which has no left child, instead.
+            tree = target.right
+            path.append(tree)
+            while tree.node.left is not None:
+                tree = tree.node.left
+                path.append(tree)
+            target.key, target.value = tree.node.key, tree.node.value
+        tree = path[-1]
+        child = tree.node.left if tree.node.left is not None \
+            else tree.node.right
+        if child is not None:
+            tree.node = child.node
+        elif len(path) == 1:
+            tree.node = None
+        else:
+            path.pop()
+            parent = path[-1].node
+            if parent.left is tree:
+                parent.left = None
+            else:
+                parent.right = None
+        self._retrace(path, -1)
+        return value
+
+    """
+    Returns the value stored with the key, or `default`.
+    """
+    def get(self, key, default=None):
+        tree = self._find(key)
+        return tree.node.value if tree is not None else default
+
+    """
+    Returns True if the key is in the tree.
+    """
+    def contains(self, key):
+        return self._find(key) is not None
+
     """
-    def insert(self, key):
-        pass
+    Returns the tree holding `key`, or None. Lookups don't need the
+    path `_search` records, so they skip building it.
+    """
+    def _find(self, key):
+        tree = self
+        while tree is not None and tree.node is not None:
+            node = tree.node
+            if key == node.key:
+                return tree
+            tree = node.left if key < node.key else node.right
+        return None
+
+    def __contains__(self, key):
+        return self.contains(key)
+
+    def __len__(self):
+        return self.size
+
+    """
+    Iterates over the keys in order, holding only the O(log n)
+    path down to the current one.
+    """
+    def __iter__(self):
+        return (key for key, _ in self.items())
+
+    """
+    Iterates over the (key, value) pairs in key order.
+    """
+    def items(self):
+        stack = []
+        tree = self if self.node is not None else None
+        while tree is not None or stack:
+            while tree is not None:
+                stack.append(tree)
+                tree = tree.node.left
+            tree = stack.pop()
+            yield tree.node.key, tree.node.value
+            tree = tree.node.right
+
+    """
+    Returns the number of keys < key. Like the other order
+    statistics below, it uses the stored subtree sizes to walk a
+    single path down the tree, so it is O(log n).
+    """
+    def rank(self, key):
+        count = 0
+        tree = self
+        while tree is not None and tree.node is not None:
+            if key <= tree.node.key:
+                tree = tree.node.left
+            else:
+                count += 1 + _size(tree.node.left)
+                tree = tree.node.right
+        return count
+
+    """
+    Returns the key at index i (from 0) in sorted order.
+    """
+    def select(self, i):
+        if not 0 <= i < self.size:
+            raise IndexError('select index out of range')
+        tree = self
+        while True:
+            left_size = _size(tree.node.left)
+            if i < left_size:
+                tree = tree.node.left
+            elif i == left_size:
+                return tree.node.key
+            else:
+                i -= left_size + 1
+                tree = tree.node.right
+
+    """
+    Returns the number of keys k with lo <= k < hi.
+    """
+    def count_range(self, lo, hi):
+        return max(0, self.rank(hi) - self.rank(lo))
+
+    """
+    Returns the middle key, or the lower of the two middle keys
+    when there is an even number of them, or None if the tree is
+    empty.
+    """
+    def median(self):
+        if self.size == 0:
+            return None
+        return self.select((self.size - 1) // 2)
+
+
+def _height(tree):
+    return tree.height if tree is not None else -1
+
+
+def _size(tree):
+    return tree.size if tree is not None else 0
+
@@ -0,0 +1,79 @@
+"""
+Compares avl_tree.AVLTree with the unbalanced
+binary_search_tree.BinarySearchTree on random and on already sorted
+keys.
+
+    python benchmark_avl.py [--sizes 1000 4000] [--lookups 20000]
+
+For each size and key order it inserts the keys one at a time, then
+looks up random keys, and reports thousands of operations per
+second and the resulting tree height. Sorted keys turn the plain
+BST into a linked list with O(n) operations, while the AVL tree
+stays O(log n) either way.
+"""
+import argparse
+import random
+import sys
+import time
+
+from avl_tree import AVLTree
+
+sys.path.append('../binary_search_tree')
+from binary_search_tree import BinarySearchTree
+
+
+def throughput(count, seconds):
+    return count / seconds / 1e3 if seconds else float('inf')
+
+
+def run_avl(keys, probes):
+    tree = AVLTree()
+    start = time.perf_counter()
+    for key in keys:
+        tree.insert(key)
+    inserted = time.perf_counter()
+    for key in probes:
+        tree.contains(key)
+    looked_up = time.perf_counter()
+    # AVLTree heights count edges; report levels to match the BST.
+    return inserted - start, looked_up - inserted, tree.height + 1
+
+
+def run_bst(keys, probes):
+    start = time.perf_counter()
+    tree = BinarySearchTree(keys[0])
+    for key in keys[1:]:
+        tree.insert(key)
+    inserted = time.perf_counter()
+    for key in probes:
+        tree.contains(key)
+    looked_up = time.perf_counter()
+    return inserted - start, looked_up - inserted, \
+        tree.depth_stats()['height']
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+', default=[1000, 4000])
+    parser.add_argument('--lookups', type=int, default=20000)
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    trees = [('AVLTree', run_avl), ('BinarySearchTree', run_bst)]
+    print(f'{"tree":<18}{"order":>8}{"size":>8}'
+          f'{"insert Kops/s":>16}{"lookup Kops/s":>16}{"height":>8}')
+    for size in args.sizes:
+        shuffled = rng.sample(range(size), size)
+        probes = [rng.randrange(size) for _ in range(args.lookups)]
+        for order, keys in (('random', shuffled), ('sorted', sorted(shuffled))):
+            for name, run in trees:
+                insert_time, lookup_time, height = run(keys, probes)
+                print(f'{name:<18}{order:>8}{size:>8}'
+                      f'{throughput(size, insert_time):>16.1f}'
+                      f'{throughput(len(probes), lookup_time):>16.1f}'
+                      f'{height:>8}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,3 +1,4 @@
+import random
 import unittest
 from avl_tree import AVLTree
 from avl_tree import Node
@@ -100,5 +101,86 @@ class AVLTreeTests(unittest.TestCase):
     self.assertEqual(self.tree.node.right.node.left.node.key, 6)
     self.assertEqual(self.tree.node.right.node.right.node.key, 8) 
 
+  def test_sequential_inserts_stay_balanced(self):
+    for key in range(1000):
+      self.tree.insert(key)
+    self.tree.insert(500)
+    self.assertEqual(self.tree.size, 1000)
+    self.assertLessEqual(self.tree.height, 14)
+    self.assertTrue(self.tree.contains(999))
+    self.assertFalse(self.tree.contains(1000))
+
+  def test_order_statistics(self):
+    keys = random.sample(range(10000), 500)
+    for key in keys:
+      self.tree.insert(key)
+    ordered = sorted(keys)
+    self.assertEqual([self.tree.select(i) for i in range(500)], ordered)
+    for key in ordered[::25]:
+      self.assertEqual(self.tree.rank(key), ordered.index(key))
+      self.assertEqual(self.tree.rank(key + 0.5), ordered.index(key) + 1)
+    self.assertEqual(self.tree.count_range(2000, 7000),
+                     sum(1 for k in keys if 2000 <= k < 7000))
+    self.assertEqual(self.tree.median(), ordered[249])
+    with self.assertRaises(IndexError):
+      self.tree.select(500)
+
+  def test_empty_order_statistics(self):
+    self.assertEqual(self.tree.rank(3), 0)
+    self.assertEqual(self.tree.count_range(0, 10), 0)
+    self.assertIsNone(self.tree.median())
+
+  def assertAVLInvariants(self, tree):
+    if tree is None or tree.node is None:
+      return
+    height, balance, size = tree.height, tree.balance, tree.size
+    tree._refresh()
+    self.assertEqual((tree.height, tree.balance, tree.size),
+                     (height, balance, size))
+    self.assertLessEqual(abs(tree.balance), 1)
+    self.assertAVLInvariants(tree.node.left)
+    self.assertAVLInvariants(tree.node.right)
+
+  def test_map_semantics(self):
+    self.tree.insert(5, 'five')
+    self.tree.insert(3, 'three')
+    self.tree.insert(5, 'FIVE')
+    self.assertEqual(len(self.tree), 2)
+    self.assertEqual(self.tree.get(5), 'FIVE')
+    self.assertIsNone(self.tree.get(4))
+    self.assertEqual(self.tree.get(4, 'none'), 'none')
+    self.assertIn(3, self.tree)
+    self.assertEqual(list(self.tree.items()), [(3, 'three'), (5, 'FIVE')])
+
+  def test_delete(self):
+    for key in [5, 3, 8, 1, 4, 7, 9, 6]:
+      self.tree.insert(key, key * 10)
+    self.assertEqual(self.tree.delete(5), 50)
+    self.assertEqual(self.tree.delete(1), 10)
+    self.assertEqual(list(self.tree), [3, 4, 6, 7, 8, 9])
+    self.assertAVLInvariants(self.tree)
+    with self.assertRaises(KeyError):
+      self.tree.delete(5)
+    for key in [3, 4, 6, 7, 8, 9]:
+      self.tree.delete(key)
+    self.assertEqual(len(self.tree), 0)
+    self.assertIsNone(self.tree.node)
+    self.tree.insert(2)
+    self.assertEqual(list(self.tree), [2])
+
+  def test_random_operations_match_a_dict(self):
+    expected = {}
+    for _ in range(3000):
+      key = random.randrange(300)
+      if key in expected and random.random() < 0.5:
+        self.assertEqual(self.tree.delete(key), expected.pop(key))
+      else:
+        expected[key] = random.random()
+        self.tree.insert(key, expected[key])
+    self.assertAVLInvariants(self.tree)
+    self.assertEqual(list(self.tree.items()), sorted(expected.items()))
+    ordered = sorted(expected)
+    self.assertEqual(self.tree.median(), ordered[(len(ordered) - 1) // 2])
+
 if __name__ == '__main__':
   unittest.main()
\ No newline at end of file
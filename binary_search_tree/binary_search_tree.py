@@ -4,54 +4,374 @@ from dll_queue import Queue
 from dll_stack import Stack
 
 
+# Values in a node's left subtree are <= its value and values in its
+# right subtree are >= it. insert sends duplicates right, but the
+# balanced builders split runs of equal values at their middle like
+# anything else, so every lookup allows for equal values on both sides
 class BinarySearchTree:
     def __init__(self, value):
         self.value = value
         self.left = None
         self.right = None
+        # The number of values in the subtree rooted here
+        self.size = 1
+
+    # Build a perfectly balanced tree from values already in
+    # ascending order, in O(n)
+    @classmethod
+    def from_sorted(cls, iterable):
+        values = list(iterable)
+        if not values:
+            raise ValueError('cannot build a tree from no values')
+        for i in range(1, len(values)):
+            if values[i] < values[i - 1]:
+                raise ValueError('values are not in ascending order')
+        return cls._build(values, 0, len(values))
+
+    # Build a balanced tree from values in any order, in O(n log n)
+    @classmethod
+    def from_iterable(cls, iterable):
+        return cls.from_sorted(sorted(iterable))
+
+    # Return a balanced tree of values[lo:hi], rooted at the middle
+    # Each call halves the range, so the recursion is at most
+    # log2(n) + 1 deep whatever the values are
+    @classmethod
+    def _build(cls, values, lo, hi):
+        if lo >= hi:
+            return None
+        mid = (lo + hi) // 2
+        node = cls(values[mid])
+        node.left = cls._build(values, lo, mid)
+        node.right = cls._build(values, mid + 1, hi)
+        node.size = hi - lo
+        return node
+
+    # Rebuild the tree in place as a perfectly balanced one, in O(n)
+    # time and memory. Worth calling after bulk inserts once
+    # depth_stats shows the height well above its minimum
+    def rebalance(self):
+        values = list(self.iter_in_order())
+        balanced = self._build(values, 0, len(values))
+        self.value = balanced.value
+        self.left = balanced.left
+        self.right = balanced.right
+
+    # Return a dict describing the shape of the tree: its size, its
+    # height (the number of nodes on the longest path from the
+    # root), the smallest height that size allows, the ratio of the
+    # two, and the average depth of a node (the root's is 1)
+    def depth_stats(self):
+        size = height = total_depth = 0
+        stack = Stack()
+        stack.push((self, 1))
+        while stack.len() > 0:
+            node, depth = stack.pop()
+            size += 1
+            total_depth += depth
+            height = max(height, depth)
+            if node.right is not None:
+                stack.push((node.right, depth + 1))
+            if node.left is not None:
+                stack.push((node.left, depth + 1))
+        min_height = size.bit_length()
+        return {
+            'size': size,
+            'height': height,
+            'min_height': min_height,
+            'height_ratio': height / min_height,
+            'average_depth': total_depth / size,
+        }
+
+    # Iterate over the values in order from low to high
+    def __iter__(self):
+        return self.iter_in_order()
 
     # Insert the given value into the tree
+    # Duplicates go to the right, so equal values keep their
+    # insertion order in an in-order walk
     def insert(self, value):
-        pass
+        node = self
+        while True:
+            node.size += 1
+            if value < node.value:
+                if node.left is None:
+                    node.left = BinarySearchTree(value)
+                    return
+                node = node.left
+            else:
+                if node.right is None:
+                    node.right = BinarySearchTree(value)
+                    return
+                node = node.right
 
     # Return True if the tree contains the value
     # False if it does not
     def contains(self, target):
-        pass
+        node = self
+        while node is not None:
+            if target == node.value:
+                return True
+            node = node.left if target < node.value else node.right
+        return False
 
     # Return the maximum value found in the tree
     def get_max(self):
-        pass
+        node = self
+        while node.right is not None:
+            node = node.right
+        return node.value
+
+    # Return the minimum value found in the tree
+    def get_min(self):
+        node = self
+        while node.left is not None:
+            node = node.left
+        return node.value
+
+    # Ordered queries ----------------------
+    # Each of these follows a single path down the tree, so costs
+    # O(height), and returns None if there is no such value
+
+    # Return the largest value <= target
+    def floor(self, target):
+        return self._closest(target, below=True, inclusive=True)
+
+    # Return the smallest value >= target
+    def ceiling(self, target):
+        return self._closest(target, below=False, inclusive=True)
+
+    # Return the smallest value > target
+    def successor(self, target):
+        return self._closest(target, below=False, inclusive=False)
+
+    # Return the largest value < target
+    def predecessor(self, target):
+        return self._closest(target, below=True, inclusive=False)
+
+    def _closest(self, target, below, inclusive):
+        best = None
+        node = self
+        while node is not None:
+            if inclusive and node.value == target:
+                return node.value
+            if below:
+                if node.value < target:
+                    best = node.value
+                    node = node.right
+                else:
+                    node = node.left
+            else:
+                if target < node.value:
+                    best = node.value
+                    node = node.left
+                else:
+                    node = node.right
+        return best
+
+    # Yield the values v with lo <= v < hi, in order
+    # Subtrees wholly outside the range are never entered, so this
+    # visits O(height + k) nodes for k results
+    def range(self, lo, hi):
+        for value in self.cursor(lo):
+            if not value < hi:
+                return
+            yield value
+
+    # Order statistics ---------------------
+    # Each node's `size` turns these into a single walk down the
+    # tree, O(height) rather than a walk over every value before
+    # the answer
+
+    # Return the number of values < target
+    def rank(self, target):
+        count = 0
+        node = self
+        while node is not None:
+            if target <= node.value:
+                node = node.left
+            else:
+                count += 1 + (node.left.size if node.left else 0)
+                node = node.right
+        return count
+
+    # Return the value at index i (from 0) of the sorted values
+    def select(self, i):
+        if not 0 <= i < self.size:
+            raise IndexError('select index out of range')
+        node = self
+        while True:
+            left_size = node.left.size if node.left else 0
+            if i < left_size:
+                node = node.left
+            elif i == left_size:
+                return node.value
+            else:
+                i -= left_size + 1
+                node = node.right
+
+    # Return the number of values v with lo <= v < hi
+    def count_range(self, lo, hi):
+        return max(0, self.rank(hi) - self.rank(lo))
+
+    # Return the middle value, or the lower of the two middle values
+    # when there is an even number of them
+    def median(self):
+        return self.select((self.size - 1) // 2)
+
+    # Return a Cursor over the values in order, starting from the
+    # first value >= start, or from the minimum if start is None
+    def cursor(self, start=None):
+        return Cursor(self, start)
 
     # Call the function `cb` on the value of each node
-    # You may use a recursive or iterative approach
+    # The walk is in order and streams, holding only the path
+    # down to the current node
     def for_each(self, cb):
-        pass
+        for value in self.iter_in_order():
+            cb(value)
+
+    # Generator traversals -----------------
+    # All of these walk with an explicit Stack or Queue rather than
+    # recursion, so a badly skewed tree can't hit the recursion
+    # limit, and yield each value as it is reached. The depth
+    # first ones hold O(height) nodes at a time, the breadth first
+    # one a level's worth.
+
+    # Yield the values in order from low to high
+    def iter_in_order(self):
+        stack = Stack()
+        node = self
+        while node is not None or stack.len() > 0:
+            while node is not None:
+                stack.push(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    # Yield each node's value before those of its subtrees,
+    # left subtree first
+    def iter_pre_order(self):
+        stack = Stack()
+        stack.push(self)
+        while stack.len() > 0:
+            node = stack.pop()
+            yield node.value
+            if node.right is not None:
+                stack.push(node.right)
+            if node.left is not None:
+                stack.push(node.left)
+
+    # Yield each node's value after those of its subtrees,
+    # left subtree first
+    def iter_post_order(self):
+        # Entries are (node, expanded). A node is pushed back as
+        # expanded above its children, so it comes off the stack
+        # again once both subtrees are done.
+        stack = Stack()
+        stack.push((self, False))
+        while stack.len() > 0:
+            node, expanded = stack.pop()
+            if expanded:
+                yield node.value
+                continue
+            stack.push((node, True))
+            if node.right is not None:
+                stack.push((node.right, False))
+            if node.left is not None:
+                stack.push((node.left, False))
+
+    # Yield the values level by level, left to right
+    def iter_level_order(self):
+        queue = Queue()
+        queue.enqueue(self)
+        while queue.len() > 0:
+            node = queue.dequeue()
+            yield node.value
+            if node.left is not None:
+                queue.enqueue(node.left)
+            if node.right is not None:
+                queue.enqueue(node.right)
 
     # DAY 2 Project -----------------------
 
     # Print all the values in order from low to high
     # Hint:  Use a recursive, depth first traversal
     def in_order_print(self, node):
-        pass
+        for value in node.iter_in_order():
+            print(value)
 
     # Print the value of every node, starting with the given node,
     # in an iterative breadth first traversal
     def bft_print(self, node):
-        pass
+        for value in node.iter_level_order():
+            print(value)
 
     # Print the value of every node, starting with the given node,
     # in an iterative depth first traversal
     def dft_print(self, node):
-        pass
+        for value in node.iter_pre_order():
+            print(value)
 
     # STRETCH Goals -------------------------
     # Note: Research may be required
 
     # Print Pre-order recursive DFT
     def pre_order_dft(self, node):
-        pass
+        for value in node.iter_pre_order():
+            print(value)
 
     # Print Post-order recursive DFT
     def post_order_dft(self, node):
-        pass
+        for value in node.iter_post_order():
+            print(value)
+
+
+class Cursor:
+    """
+    A position in a BinarySearchTree's in-order sequence that can
+    be stepped forward, paused and picked up again later, or moved
+    with `seek`. It keeps the unfinished part of the path from the
+    root on a Stack, so each step is amortized O(1) and it holds
+    O(height) nodes. Values inserted while a cursor is open may or
+    may not be reached by it; `seek` picks them up.
+    """
+    def __init__(self, tree, start=None):
+        self.tree = tree
+        self.seek(start)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.stack.len() == 0:
+            raise StopIteration
+        node = self.stack.pop()
+        self._descend(node.right, None)
+        return node.value
+
+    # Return the value `next` would return, without moving,
+    # or None at the end
+    def peek(self):
+        if self.stack.len() == 0:
+            return None
+        node = self.stack.pop()
+        self.stack.push(node)
+        return node.value
+
+    # Move the cursor to the first value >= start, or to the
+    # minimum if start is None
+    def seek(self, start):
+        self.stack = Stack()
+        self._descend(self.tree, start)
+
+    # Push the path to the smallest value >= start in the subtree,
+    # skipping nodes (and their left subtrees) that are below start
+    def _descend(self, node, start):
+        while node is not None:
+            if start is not None and node.value < start:
+                node = node.right
+            else:
+                self.stack.push(node)
+                node = node.left
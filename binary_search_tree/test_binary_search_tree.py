@@ -62,6 +62,162 @@ class BinarySearchTreeTests(unittest.TestCase):
         self.assertTrue(v4 in arr)
         self.assertTrue(v5 in arr)
 
+    def test_generator_traversals(self):
+        for value in [8, 5, 7, 6, 3, 4, 2]:
+            self.bst.insert(value)
+        self.assertEqual(list(self.bst), [2, 3, 4, 5, 5, 6, 7, 8])
+        self.assertEqual(list(self.bst.iter_pre_order()),
+                         [5, 3, 2, 4, 8, 5, 7, 6])
+        self.assertEqual(list(self.bst.iter_post_order()),
+                         [2, 4, 3, 6, 7, 5, 8, 5])
+        self.assertEqual(list(self.bst.iter_level_order()),
+                         [5, 3, 8, 2, 4, 5, 7, 6])
+
+    def test_traversals_are_lazy(self):
+        for value in [3, 8, 1]:
+            self.bst.insert(value)
+        walk = self.bst.iter_in_order()
+        self.assertEqual(next(walk), 1)
+        self.assertEqual(next(walk), 3)
+
+    def test_skewed_tree_does_not_recurse(self):
+        self.bst = BinarySearchTree(0)
+        depth = sys.getrecursionlimit() + 500
+        for value in range(1, depth):
+            self.bst.insert(value)
+        self.assertEqual(list(self.bst), list(range(depth)))
+        self.assertEqual(next(self.bst.iter_post_order()), depth - 1)
+        self.assertTrue(self.bst.contains(depth - 1))
+        self.assertEqual(self.bst.get_max(), depth - 1)
+
+    def test_ordered_queries(self):
+        for value in [2, 9, 7, 3, 12]:
+            self.bst.insert(value)
+        self.assertEqual(self.bst.get_min(), 2)
+        self.assertEqual(self.bst.floor(8), 7)
+        self.assertEqual(self.bst.floor(7), 7)
+        self.assertIsNone(self.bst.floor(1))
+        self.assertEqual(self.bst.ceiling(4), 5)
+        self.assertEqual(self.bst.ceiling(5), 5)
+        self.assertIsNone(self.bst.ceiling(13))
+        self.assertEqual(self.bst.successor(5), 7)
+        self.assertEqual(self.bst.successor(6), 7)
+        self.assertIsNone(self.bst.successor(12))
+        self.assertEqual(self.bst.predecessor(5), 3)
+        self.assertIsNone(self.bst.predecessor(2))
+
+    def test_range(self):
+        values = random.sample(range(1000), 200)
+        self.bst = BinarySearchTree(values[0])
+        for value in values[1:]:
+            self.bst.insert(value)
+        self.assertEqual(list(self.bst.range(250, 600)),
+                         sorted(v for v in values if 250 <= v < 600))
+        self.assertEqual(list(self.bst.range(600, 250)), [])
+
+    def test_cursor_resumes_and_seeks(self):
+        for value in [2, 9, 7, 3, 12]:
+            self.bst.insert(value)
+        cursor = self.bst.cursor(4)
+        self.assertEqual(cursor.peek(), 5)
+        self.assertEqual([next(cursor), next(cursor)], [5, 7])
+        self.assertEqual(list(cursor), [9, 12])
+        self.assertIsNone(cursor.peek())
+        cursor.seek(None)
+        self.assertEqual(next(cursor), 2)
+        cursor.seek(8)
+        self.assertEqual(list(cursor), [9, 12])
+
+    def test_from_sorted_is_balanced(self):
+        self.bst = BinarySearchTree.from_sorted(range(1000))
+        self.assertEqual(list(self.bst), list(range(1000)))
+        stats = self.bst.depth_stats()
+        self.assertEqual(stats['size'], 1000)
+        self.assertEqual(stats['height'], stats['min_height'])
+        with self.assertRaises(ValueError):
+            BinarySearchTree.from_sorted([2, 1])
+        with self.assertRaises(ValueError):
+            BinarySearchTree.from_sorted([])
+
+    def test_from_sorted_balances_duplicates(self):
+        for values in ([1] * 64, [7] * 5000,
+                       [1] + [2] * 3000 + [3, 4, 5]):
+            self.bst = BinarySearchTree.from_sorted(values)
+            stats = self.bst.depth_stats()
+            self.assertEqual(stats['height'], stats['min_height'])
+            self.assertEqual(list(self.bst), values)
+            self.assertTrue(self.bst.contains(values[-1]))
+            self.assertEqual(self.bst.rank(2), values.count(1))
+            self.assertEqual(self.bst.count_range(2, 3), values.count(2))
+            self.assertEqual(list(self.bst.range(2, 3)),
+                             [v for v in values if v == 2])
+            self.assertEqual(self.bst.ceiling(values[0]), values[0])
+            self.assertEqual(self.bst.successor(values[0]),
+                             next((v for v in values if v > values[0]), None))
+            self.assertEqual(self.bst.predecessor(values[-1]),
+                             next((v for v in reversed(values)
+                                   if v < values[-1]), None))
+
+    def test_rebalance_duplicates(self):
+        self.bst = BinarySearchTree(3)
+        for _ in range(2999):
+            self.bst.insert(3)
+        self.bst.insert(1)
+        self.bst.rebalance()
+        stats = self.bst.depth_stats()
+        self.assertEqual(stats['height'], stats['min_height'])
+        self.assertEqual(self.bst.size, 3001)
+        self.bst.insert(3)
+        self.assertEqual(self.bst.count_range(3, 4), 3001)
+        self.assertEqual(self.bst.get_min(), 1)
+        self.assertEqual(self.bst.floor(2), 1)
+
+    def test_from_iterable(self):
+        values = [random.randrange(100) for _ in range(300)]
+        self.bst = BinarySearchTree.from_iterable(values)
+        self.assertEqual(list(self.bst), sorted(values))
+
+    def test_rebalance(self):
+        self.bst = BinarySearchTree(0)
+        for value in range(1, 100):
+            self.bst.insert(value)
+        self.assertEqual(self.bst.depth_stats()['height'], 100)
+        root = self.bst
+        self.bst.rebalance()
+        self.assertIs(self.bst, root)
+        stats = self.bst.depth_stats()
+        self.assertEqual(stats['height'], 7)
+        self.assertEqual(stats['height_ratio'], 1)
+        self.assertEqual(list(self.bst), list(range(100)))
+        self.assertEqual(self.bst.size, 100)
+
+    def test_order_statistics(self):
+        values = [random.randrange(50) for _ in range(200)]
+        for value in values:
+            self.bst.insert(value)
+        ordered = sorted(values + [5])
+        self.assertEqual(self.bst.size, 201)
+        self.assertEqual([self.bst.select(i) for i in range(201)], ordered)
+        for target in range(-1, 52):
+            self.assertEqual(self.bst.rank(target),
+                             sum(1 for v in ordered if v < target))
+        self.assertEqual(self.bst.count_range(10, 20),
+                         sum(1 for v in ordered if 10 <= v < 20))
+        self.assertEqual(self.bst.count_range(20, 10), 0)
+        self.assertEqual(self.bst.median(), ordered[100])
+        with self.assertRaises(IndexError):
+            self.bst.select(201)
+
+    def test_sizes_survive_bulk_load_and_rebalance(self):
+        self.bst = BinarySearchTree.from_sorted([1, 2, 2, 4, 8])
+        self.bst.insert(3)
+        self.assertEqual(self.bst.size, 6)
+        self.assertEqual(self.bst.select(3), 3)
+        self.bst.rebalance()
+        self.assertEqual(self.bst.size, 6)
+        self.assertEqual(self.bst.rank(4), 4)
+        self.assertEqual(self.bst.median(), 2)
+
     def test_print_traversals(self):
         # WARNING:  Tests are for Print()
         # Debug calls to Print() in functions will cause failure
@@ -35,15 +35,104 @@ class ListNode:
             self.next.prev = self.prev
 
 
+"""Tracks the maximum and minimum of a sequence that only
+changes at its ends. The sequence is split across two stacks,
+one growing towards the head and one towards the tail, and every
+stack entry caches the max and min of the entries beneath it, so
+both extremes are read off the two stack tops in O(1). When one
+stack runs dry the other is split in half, which keeps pops
+amortized O(1). Changes to the middle of the sequence can't be
+tracked this way, so they mark the tracker stale and it is
+rebuilt from the values on the next query."""
+
+
+class MinMaxDeque:
+    def __init__(self, values=()):
+        self.rebuild(values)
+
+    """Replaces the tracked sequence with the given values,
+    ordered from head to tail."""
+    def rebuild(self, values):
+        values = list(values)
+        mid = len(values) // 2
+        self.front = []
+        self.back = []
+        self.stale = False
+        for value in reversed(values[:mid]):
+            self._push(self.front, value)
+        for value in values[mid:]:
+            self._push(self.back, value)
+
+    def _push(self, stack, value):
+        if stack:
+            _, hi, lo = stack[-1]
+            stack.append((value,
+                          value if value > hi else hi,
+                          value if value < lo else lo))
+        else:
+            stack.append((value, value, value))
+
+    def push_front(self, value):
+        if not self.stale:
+            self._push(self.front, value)
+
+    def push_back(self, value):
+        if not self.stale:
+            self._push(self.back, value)
+
+    def pop_front(self):
+        if self.stale:
+            return
+        if not self.front:
+            if len(self.back) <= 1:
+                self.back.clear()
+                return
+            self.rebuild([entry[0] for entry in self.back])
+        self.front.pop()
+
+    def pop_back(self):
+        if self.stale:
+            return
+        if not self.back:
+            if len(self.front) <= 1:
+                self.front.clear()
+                return
+            self.rebuild([entry[0] for entry in reversed(self.front)])
+        self.back.pop()
+
+    def max(self):
+        if self.front and self.back:
+            return max(self.front[-1][1], self.back[-1][1])
+        if self.front:
+            return self.front[-1][1]
+        if self.back:
+            return self.back[-1][1]
+        return None
+
+    def min(self):
+        if self.front and self.back:
+            return min(self.front[-1][2], self.back[-1][2])
+        if self.front:
+            return self.front[-1][2]
+        if self.back:
+            return self.back[-1][2]
+        return None
+
+
 """Our doubly-linked list class. It holds references to
-the list's head and tail nodes."""
+the list's head and tail nodes. Passing `track_extremes=True`
+keeps a MinMaxDeque alongside the nodes so that `get_max` and
+`get_min` answer in amortized O(1) instead of scanning the list."""
 
 
 class DoublyLinkedList:
-    def __init__(self, node=None):
+    def __init__(self, node=None, track_extremes=False):
         self.head = node
         self.tail = node
         self.length = 1 if node is not None else 0
+        self.extremes = None
+        if track_extremes:
+            self.extremes = MinMaxDeque([] if node is None else [node.value])
 
     def __len__(self):
         return self.length
@@ -52,41 +141,235 @@ class DoublyLinkedList:
     as the new head of the list. Don't forget to handle 
     the old head node's previous pointer accordingly."""
     def add_to_head(self, value):
-        pass
+        new_node = ListNode(value, None, self.head)
+        if self.head is None:
+            self.tail = new_node
+        else:
+            self.head.prev = new_node
+        self.head = new_node
+        self.length += 1
+        if self.extremes is not None:
+            self.extremes.push_front(value)
 
     """Removes the List's current head node, making the
     current head's next node the new head of the List.
     Returns the value of the removed Node."""
     def remove_from_head(self):
-        pass
+        if self.head is None:
+            return None
+        value = self.head.value
+        self.delete(self.head)
+        return value
 
     """Wraps the given value in a ListNode and inserts it 
     as the new tail of the list. Don't forget to handle 
     the old tail node's next pointer accordingly."""
     def add_to_tail(self, value):
-        pass
+        new_node = ListNode(value, self.tail, None)
+        if self.tail is None:
+            self.head = new_node
+        else:
+            self.tail.next = new_node
+        self.tail = new_node
+        self.length += 1
+        if self.extremes is not None:
+            self.extremes.push_back(value)
 
     """Removes the List's current tail node, making the 
     current tail's previous node the new tail of the List.
     Returns the value of the removed Node."""
     def remove_from_tail(self):
-        pass
+        if self.tail is None:
+            return None
+        value = self.tail.value
+        self.delete(self.tail)
+        return value
 
     """Removes the input node from its current spot in the 
     List and inserts it as the new head node of the List."""
     def move_to_front(self, node):
-        pass
+        if node is self.head:
+            return
+        self.delete(node)
+        node.prev = None
+        node.next = self.head
+        if self.head is None:
+            self.tail = node
+        else:
+            self.head.prev = node
+        self.head = node
+        self.length += 1
+        if self.extremes is not None:
+            self.extremes.push_front(node.value)
 
     """Removes the input node from its current spot in the 
     List and inserts it as the new tail node of the List."""
     def move_to_end(self, node):
-        pass
+        if node is self.tail:
+            return
+        self.delete(node)
+        node.next = None
+        node.prev = self.tail
+        if self.tail is None:
+            self.head = node
+        else:
+            self.tail.next = node
+        self.tail = node
+        self.length += 1
+        if self.extremes is not None:
+            self.extremes.push_back(node.value)
 
     """Removes a node from the list and handles cases where
     the node was the head or the tail"""
     def delete(self, node):
-        pass
-        
+        if self.extremes is not None:
+            if node is self.head:
+                self.extremes.pop_front()
+            elif node is self.tail:
+                self.extremes.pop_back()
+            else:
+                self.extremes.stale = True
+        if node is self.head:
+            self.head = node.next
+        if node is self.tail:
+            self.tail = node.prev
+        node.delete()
+        node.prev = None
+        node.next = None
+        self.length -= 1
+
+    """Wraps every value in the iterable in a ListNode and
+    appends them to the tail of the list, in order. The new
+    nodes are chained together locally and linked onto the
+    list in one step."""
+    def extend(self, iterable):
+        first = last = None
+        count = 0
+        for value in iterable:
+            node = ListNode(value, last, None)
+            if last is None:
+                first = node
+            else:
+                last.next = node
+            last = node
+            count += 1
+        if first is None:
+            return
+        if self.tail is None:
+            self.head = first
+        else:
+            self.tail.next = first
+            first.prev = self.tail
+        self.tail = last
+        self.length += count
+        if self.extremes is not None:
+            for value in self._values_from(first):
+                self.extremes.push_back(value)
+
+    """Adds every value in the iterable to the head of the
+    list. Like `collections.deque.extendleft`, each value is
+    put in front of the previous one, so the values end up in
+    reverse order."""
+    def extendleft(self, iterable):
+        first = last = None
+        count = 0
+        for value in iterable:
+            node = ListNode(value, None, first)
+            if first is None:
+                last = node
+            else:
+                first.prev = node
+            first = node
+            count += 1
+        if first is None:
+            return
+        if self.head is None:
+            self.tail = last
+        else:
+            self.head.prev = last
+            last.next = self.head
+        self.head = first
+        self.length += count
+        if self.extremes is not None:
+            current = last
+            while current is not None:
+                self.extremes.push_front(current.value)
+                current = current.prev
+
+    """Moves every node of `other` into this list, right after
+    `at_node`, or at the front of the list when `at_node` is
+    None. Only the nodes at the seams are relinked, so this is
+    O(1) however long `other` is. `other` is left empty."""
+    def splice(self, other, at_node=None):
+        if other is self:
+            raise ValueError("cannot splice a list into itself")
+        if other.head is None:
+            return
+        first, last = other.head, other.tail
+        if at_node is None:
+            after = self.head
+            self.head = first
+        else:
+            after = at_node.next
+            at_node.next = first
+        first.prev = at_node
+        last.next = after
+        if after is None:
+            self.tail = last
+        else:
+            after.prev = last
+        self.length += other.length
+        if self.extremes is not None:
+            self.extremes.stale = True
+
+        other.head = other.tail = None
+        other.length = 0
+        if other.extremes is not None:
+            other.extremes.rebuild([])
+
+    """Unlinks every node in `nodes` from the list, updating
+    the length once at the end."""
+    def delete_many(self, nodes):
+        count = 0
+        for node in nodes:
+            if node is self.head:
+                self.head = node.next
+            if node is self.tail:
+                self.tail = node.prev
+            node.delete()
+            node.prev = None
+            node.next = None
+            count += 1
+        self.length -= count
+        if count and self.extremes is not None:
+            self.extremes.stale = True
+
+    def _values_from(self, node):
+        while node is not None:
+            yield node.value
+            node = node.next
+
+    """Yields the values in the list from head to tail."""
+    def __iter__(self):
+        return self._values_from(self.head)
+
+    def _fresh_extremes(self):
+        if self.extremes.stale:
+            self.extremes.rebuild(self)
+        return self.extremes
+
     """Returns the highest value currently in the list"""
     def get_max(self):
-        pass
+        if self.extremes is not None:
+            return self._fresh_extremes().max()
+        if self.head is None:
+            return None
+        return max(self)
+
+    """Returns the lowest value currently in the list"""
+    def get_min(self):
+        if self.extremes is not None:
+            return self._fresh_extremes().min()
+        if self.head is None:
+            return None
+        return min(self)
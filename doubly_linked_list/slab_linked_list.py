@@ -0,0 +1,157 @@
+"""A doubly-linked list whose nodes live in parallel arrays
+instead of individual ListNode objects. Each node is identified
+by an integer handle (its slot index); the prev and next links
+are stored in `array('l')` columns and freed slots are recycled
+through a free-list threaded through the `next` column."""
+from array import array
+
+# Marks the absence of a node, the same way `None` does for ListNode.
+NIL = -1
+
+
+class SlabLinkedList:
+    def __init__(self, capacity=0):
+        self.head = NIL
+        self.tail = NIL
+        self.length = 0
+        self.values = [None] * capacity
+        self.prev = array('l', [NIL]) * capacity
+        # Every pre-allocated slot starts out chained on the free-list.
+        self.next = array('l', range(1, capacity + 1))
+        if capacity:
+            self.next[capacity - 1] = NIL
+        self.free = 0 if capacity else NIL
+
+    def __len__(self):
+        return self.length
+
+    """Iterates over the list's values from head to tail."""
+    def __iter__(self):
+        handle = self.head
+        while handle != NIL:
+            yield self.values[handle]
+            handle = self.next[handle]
+
+    """Returns the value stored in the node with the given handle."""
+    def get(self, handle):
+        return self.values[handle]
+
+    """Overwrites the value stored in the node with the given handle."""
+    def set(self, handle, value):
+        self.values[handle] = value
+
+    """Takes a slot off the free-list, growing the backing arrays
+    when none are left, and stores the value in it."""
+    def _allocate(self, value, prev, next):
+        handle = self.free
+        if handle == NIL:
+            handle = len(self.values)
+            self.values.append(value)
+            self.prev.append(prev)
+            self.next.append(next)
+        else:
+            self.free = self.next[handle]
+            self.values[handle] = value
+            self.prev[handle] = prev
+            self.next[handle] = next
+        return handle
+
+    """Returns a slot to the free-list, dropping the reference to
+    its value so it can be garbage collected."""
+    def _release(self, handle):
+        self.values[handle] = None
+        self.prev[handle] = NIL
+        self.next[handle] = self.free
+        self.free = handle
+
+    """Unlinks the node from its neighbours without releasing
+    its slot."""
+    def _unlink(self, handle):
+        prev = self.prev[handle]
+        next = self.next[handle]
+        if prev == NIL:
+            self.head = next
+        else:
+            self.next[prev] = next
+        if next == NIL:
+            self.tail = prev
+        else:
+            self.prev[next] = prev
+        self.length -= 1
+
+    """Links an unlinked node in as the new head of the list."""
+    def _link_head(self, handle):
+        self.prev[handle] = NIL
+        self.next[handle] = self.head
+        if self.head == NIL:
+            self.tail = handle
+        else:
+            self.prev[self.head] = handle
+        self.head = handle
+        self.length += 1
+
+    """Links an unlinked node in as the new tail of the list."""
+    def _link_tail(self, handle):
+        self.next[handle] = NIL
+        self.prev[handle] = self.tail
+        if self.tail == NIL:
+            self.head = handle
+        else:
+            self.next[self.tail] = handle
+        self.tail = handle
+        self.length += 1
+
+    """Stores the value in a free slot and inserts it as the new
+    head of the list. Returns the handle of the new node."""
+    def add_to_head(self, value):
+        handle = self._allocate(value, NIL, NIL)
+        self._link_head(handle)
+        return handle
+
+    """Stores the value in a free slot and inserts it as the new
+    tail of the list. Returns the handle of the new node."""
+    def add_to_tail(self, value):
+        handle = self._allocate(value, NIL, NIL)
+        self._link_tail(handle)
+        return handle
+
+    """Removes the List's current head node and returns its value."""
+    def remove_from_head(self):
+        if self.head == NIL:
+            return None
+        return self.delete(self.head)
+
+    """Removes the List's current tail node and returns its value."""
+    def remove_from_tail(self):
+        if self.tail == NIL:
+            return None
+        return self.delete(self.tail)
+
+    """Moves the node with the given handle to the front of the List."""
+    def move_to_front(self, handle):
+        if handle == self.head:
+            return
+        self._unlink(handle)
+        self._link_head(handle)
+
+    """Moves the node with the given handle to the end of the List."""
+    def move_to_end(self, handle):
+        if handle == self.tail:
+            return
+        self._unlink(handle)
+        self._link_tail(handle)
+
+    """Removes the node with the given handle from the list and
+    recycles its slot. Returns the value that was stored in it.
+    The handle must not be used again after it has been deleted."""
+    def delete(self, handle):
+        value = self.values[handle]
+        self._unlink(handle)
+        self._release(handle)
+        return value
+
+    """Returns the highest value currently in the list"""
+    def get_max(self):
+        if self.head == NIL:
+            return None
+        return max(self)
@@ -150,6 +150,117 @@ class DoublyLinkedListTests(unittest.TestCase):
         self.dll.add_to_tail(101)
         self.assertEqual(self.dll.get_max(), 101)
 
+    def test_extend(self):
+        self.dll.extend([2, 3, 4])
+        self.assertEqual(list(self.dll), [1, 2, 3, 4])
+        self.assertEqual(self.dll.tail.value, 4)
+        self.assertEqual(self.dll.tail.prev.value, 3)
+        self.assertEqual(len(self.dll), 4)
+
+        empty = DoublyLinkedList()
+        empty.extend(iter([7, 8]))
+        self.assertEqual(empty.head.value, 7)
+        self.assertEqual(empty.tail.value, 8)
+        self.assertEqual(len(empty), 2)
+
+    def test_extendleft(self):
+        self.dll.extendleft([2, 3])
+        self.assertEqual(list(self.dll), [3, 2, 1])
+        self.assertEqual(self.dll.head.next.prev, self.dll.head)
+        self.assertEqual(self.dll.tail.value, 1)
+        self.assertEqual(len(self.dll), 3)
+
+    def test_splice(self):
+        self.dll.add_to_tail(4)
+        other = DoublyLinkedList()
+        other.extend([2, 3])
+
+        self.dll.splice(other, self.node)
+        self.assertEqual(list(self.dll), [1, 2, 3, 4])
+        self.assertEqual(self.dll.tail.prev.value, 3)
+        self.assertEqual(len(self.dll), 4)
+        self.assertIsNone(other.head)
+        self.assertEqual(len(other), 0)
+
+        other.extend([0])
+        self.dll.splice(other)
+        self.assertEqual(self.dll.head.value, 0)
+        self.assertEqual(self.dll.head.next.prev, self.dll.head)
+
+        other.extend([5, 6])
+        self.dll.splice(other, self.dll.tail)
+        self.assertEqual(list(self.dll), [0, 1, 2, 3, 4, 5, 6])
+        self.assertEqual(self.dll.tail.value, 6)
+        self.assertEqual(len(self.dll), 7)
+
+    def test_delete_many(self):
+        self.dll.extend([2, 3, 4, 5])
+        nodes = [self.dll.head, self.dll.head.next.next, self.dll.tail]
+        self.dll.delete_many(nodes)
+        self.assertEqual(list(self.dll), [2, 4])
+        self.assertEqual(self.dll.head.value, 2)
+        self.assertEqual(self.dll.tail.value, 4)
+        self.assertEqual(len(self.dll), 2)
+
+    def test_tracked_get_max_and_min(self):
+        dll = DoublyLinkedList(ListNode(5), track_extremes=True)
+        self.assertEqual(dll.get_max(), 5)
+        self.assertEqual(dll.get_min(), 5)
+
+        dll.add_to_tail(9)
+        dll.add_to_head(2)
+        dll.add_to_tail(7)
+        self.assertEqual(dll.get_max(), 9)
+        self.assertEqual(dll.get_min(), 2)
+
+        self.assertEqual(dll.remove_from_head(), 2)
+        self.assertEqual(dll.get_min(), 5)
+        self.assertEqual(dll.remove_from_head(), 5)
+        self.assertEqual(dll.remove_from_head(), 9)
+        self.assertEqual(dll.get_max(), 7)
+        self.assertEqual(dll.remove_from_tail(), 7)
+        self.assertIsNone(dll.get_max())
+        self.assertIsNone(dll.get_min())
+
+    def test_tracked_extremes_survive_middle_delete(self):
+        dll = DoublyLinkedList(track_extremes=True)
+        for value in [4, 8, 1, 6]:
+            dll.add_to_tail(value)
+        dll.delete(dll.head.next)
+        self.assertEqual(dll.get_max(), 6)
+        dll.move_to_front(dll.head.next)
+        self.assertEqual(dll.get_min(), 1)
+        dll.add_to_head(0)
+        self.assertEqual(dll.get_min(), 0)
+        self.assertEqual(list(dll), [0, 1, 4, 6])
+
+    def test_tracked_extremes_with_bulk_operations(self):
+        dll = DoublyLinkedList(track_extremes=True)
+        dll.extend([4, 8])
+        dll.extendleft([1, 9])
+        self.assertEqual(dll.get_max(), 9)
+        self.assertEqual(dll.get_min(), 1)
+
+        other = DoublyLinkedList(track_extremes=True)
+        other.extend([12, -3])
+        dll.splice(other, dll.tail)
+        self.assertEqual(dll.get_max(), 12)
+        self.assertIsNone(other.get_max())
+
+        dll.delete_many([dll.tail, dll.tail.prev])
+        self.assertEqual(dll.get_min(), 1)
+
+    def test_tracked_sliding_window(self):
+        values = [3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5, 8, 9, 7, 9]
+        dll = DoublyLinkedList(track_extremes=True)
+        for i, value in enumerate(values):
+            dll.add_to_tail(value)
+            if len(dll) > 4:
+                dll.remove_from_head()
+            window = values[max(0, i - 3):i + 1]
+            self.assertEqual(dll.get_max(), max(window))
+            self.assertEqual(dll.get_min(), min(window))
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -0,0 +1,70 @@
+import unittest
+from slab_linked_list import SlabLinkedList, NIL
+
+
+class SlabLinkedListTests(unittest.TestCase):
+    def setUp(self):
+        self.dll = SlabLinkedList()
+
+    def test_add_to_head_and_tail(self):
+        self.dll.add_to_tail(1)
+        self.dll.add_to_head(0)
+        self.dll.add_to_tail(2)
+        self.assertEqual(list(self.dll), [0, 1, 2])
+        self.assertEqual(self.dll.get(self.dll.head), 0)
+        self.assertEqual(self.dll.get(self.dll.tail), 2)
+        self.assertEqual(len(self.dll), 3)
+
+    def test_remove_from_head_and_tail(self):
+        self.assertIsNone(self.dll.remove_from_head())
+        self.assertIsNone(self.dll.remove_from_tail())
+
+        self.dll.add_to_tail(1)
+        self.dll.add_to_tail(2)
+        self.dll.add_to_tail(3)
+        self.assertEqual(self.dll.remove_from_head(), 1)
+        self.assertEqual(self.dll.remove_from_tail(), 3)
+        self.assertEqual(self.dll.remove_from_tail(), 2)
+        self.assertEqual(self.dll.head, NIL)
+        self.assertEqual(self.dll.tail, NIL)
+        self.assertEqual(len(self.dll), 0)
+
+    def test_move_to_front_and_end(self):
+        a = self.dll.add_to_tail('a')
+        b = self.dll.add_to_tail('b')
+        c = self.dll.add_to_tail('c')
+
+        self.dll.move_to_front(c)
+        self.assertEqual(list(self.dll), ['c', 'a', 'b'])
+        self.dll.move_to_end(a)
+        self.assertEqual(list(self.dll), ['c', 'b', 'a'])
+        self.dll.move_to_end(b)
+        self.assertEqual(list(self.dll), ['c', 'a', 'b'])
+        self.assertEqual(len(self.dll), 3)
+
+    def test_delete_recycles_slots(self):
+        handles = [self.dll.add_to_tail(i) for i in range(5)]
+        self.assertEqual(self.dll.delete(handles[2]), 2)
+        self.assertEqual(list(self.dll), [0, 1, 3, 4])
+
+        reused = self.dll.add_to_head(9)
+        self.assertEqual(reused, handles[2])
+        self.assertEqual(len(self.dll.values), 5)
+        self.assertEqual(list(self.dll), [9, 0, 1, 3, 4])
+
+    def test_preallocated_capacity(self):
+        dll = SlabLinkedList(4)
+        handles = [dll.add_to_tail(i) for i in range(6)]
+        self.assertEqual(handles[:4], [0, 1, 2, 3])
+        self.assertEqual(list(dll), [0, 1, 2, 3, 4, 5])
+
+    def test_get_max(self):
+        self.assertIsNone(self.dll.get_max())
+        self.dll.add_to_tail(100)
+        self.dll.add_to_tail(55)
+        self.dll.add_to_head(101)
+        self.assertEqual(self.dll.get_max(), 101)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+"""
+Compares insert and delete throughput of max_heap.Heap and
+generic_heap.Heap across arities and heap sizes.
+
+    python benchmark_arity.py [--sizes 10000 100000] [--arities 2 4 8]
+
+Each run inserts `size` random values one at a time and then
+deletes them all, and reports millions of operations per second
+for each phase.
+"""
+import argparse
+import random
+import time
+
+import generic_heap
+import max_heap
+
+
+def throughput(count, seconds):
+    return count / seconds / 1e6 if seconds else float('inf')
+
+
+def run(make_heap, values):
+    heap = make_heap()
+    start = time.perf_counter()
+    for value in values:
+        heap.insert(value)
+    inserted = time.perf_counter()
+    for _ in range(len(values)):
+        heap.delete()
+    deleted = time.perf_counter()
+    return (throughput(len(values), inserted - start),
+            throughput(len(values), deleted - inserted))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--sizes', type=int, nargs='+',
+                        default=[10000, 100000, 1000000])
+    parser.add_argument('--arities', type=int, nargs='+', default=[2, 4, 8])
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    heaps = [
+        ('max_heap', lambda arity: max_heap.Heap(arity)),
+        ('generic_heap', lambda arity: generic_heap.Heap(arity=arity)),
+    ]
+    print(f'{"heap":<14}{"size":>10}{"arity":>7}'
+          f'{"insert Mops/s":>16}{"delete Mops/s":>16}')
+    for size in args.sizes:
+        values = [rng.random() for _ in range(size)]
+        for name, make_heap in heaps:
+            for arity in args.arities:
+                insert_rate, delete_rate = run(lambda: make_heap(arity), values)
+                print(f'{name:<14}{size:>10}{arity:>7}'
+                      f'{insert_rate:>16.3f}{delete_rate:>16.3f}')
+
+
+if __name__ == '__main__':
+    main()
@@ -1,22 +1,331 @@
+import itertools
+import operator
+
+
 class Heap:
-    def __init__(self, comparator):
+    """
+    `comparator(a, b)` returns True when `a` should be closer to
+    the top of the heap than `b`. Without one the heap is a max
+    heap. `arity` is the number of children per node, as in
+    max_heap.Heap.
+
+    Passing `key` instead of a comparator orders values by
+    `key(value)`, largest first, or smallest first if `min_heap` is
+    set. Each key is computed once, on insert, and `storage` holds
+    (key, seq, value) entries compared with the C-level
+    `operator.gt`/`operator.lt`, so no Python function runs per
+    comparison. `seq` is an insertion counter (negated for a max
+    heap) that breaks ties first-in, first-out and keeps values
+    from ever being compared.
+    """
+    def __init__(self, comparator=None, arity=2, key=None, min_heap=False):
+        if arity < 2:
+            raise ValueError('arity must be at least 2')
         self.storage = []
-        self.comparator = comparator
+        self.arity = arity
+        self.key = key
+        self.min_heap = min_heap
+        if key is None:
+            self.comparator = comparator or (lambda x, y: x > y)
+        elif comparator is not None:
+            raise ValueError('pass either a comparator or a key, not both')
+        else:
+            self.comparator = operator.lt if min_heap else operator.gt
+            self.sequence = itertools.count()
+
+    def _entry(self, value):
+        seq = next(self.sequence)
+        return (self.key(value), seq if self.min_heap else -seq, value)
+
+    """
+    Builds a heap out of all the given values at once, using
+    Floyd's bottom-up construction, which is O(n) rather than the
+    O(n log n) of inserting them one at a time.
+    """
+    @classmethod
+    def from_iterable(cls, values, comparator=None, arity=2, key=None,
+                      min_heap=False):
+        heap = cls(comparator, arity, key, min_heap)
+        if key is None:
+            heap.storage = list(values)
+        else:
+            heap.storage = [heap._entry(value) for value in values]
+        heap.heapify()
+        return heap
 
     def insert(self, value):
-        pass
+        if self.key is not None:
+            value = self._entry(value)
+        self.storage.append(value)
+        self._bubble_up(len(self.storage) - 1)
+
+    """
+    Inserts every value in `values`. For a batch of k values going
+    into a heap of n, the values are appended and the whole heap is
+    rebuilt with `heapify` when k * log(n + k) > n + k, where that
+    beats bubbling each value up.
+    """
+    def insert_many(self, values):
+        values = list(values)
+        total = len(self.storage) + len(values)
+        if len(values) * total.bit_length() > total:
+            if self.key is not None:
+                values = [self._entry(value) for value in values]
+            self.storage.extend(values)
+            self.heapify()
+        else:
+            for value in values:
+                self.insert(value)
 
     def delete(self):
-        pass
+        storage = self.storage
+        if not storage:
+            return None
+        last = storage.pop()
+        if storage:
+            top = storage[0]
+            storage[0] = last
+            self._sift_down(0)
+        else:
+            top = last
+        return top if self.key is None else top[2]
+
+    """
+    Removes and returns the top value and inserts `value` in its
+    place, with one sift down instead of a delete and an insert.
+    Returns None, and just inserts, if the heap is empty.
+    """
+    def replace(self, value):
+        storage = self.storage
+        if not storage:
+            self.insert(value)
+            return None
+        if self.key is not None:
+            value = self._entry(value)
+        top = storage[0]
+        storage[0] = value
+        self._sift_down(0)
+        return top if self.key is None else top[2]
 
     def get_priority(self):
-        pass
+        if not self.storage:
+            return None
+        top = self.storage[0]
+        return top if self.key is None else top[2]
 
     def get_size(self):
-        pass
+        return len(self.storage)
+
+    """
+    Restores the heap property over the whole of `storage` by
+    sifting down every parent, starting from the last one.
+    """
+    def heapify(self):
+        for index in range((len(self.storage) - 2) // self.arity, -1, -1):
+            self._sift_down(index)
+
+    def _bubble_up(self, index):
+        storage = self.storage
+        comparator = self.comparator
+        arity = self.arity
+        value = storage[index]
+        while index > 0:
+            parent = (index - 1) // arity
+            if not comparator(value, storage[parent]):
+                break
+            storage[index] = storage[parent]
+            index = parent
+        storage[index] = value
+
+    def _sift_down(self, index):
+        storage = self.storage
+        comparator = self.comparator
+        arity = self.arity
+        size = len(storage)
+        value = storage[index]
+        while True:
+            child = arity * index + 1
+            if child >= size:
+                break
+            if arity == 2:
+                # The binary case is common enough to skip the loop.
+                right = child + 1
+                if right < size and comparator(storage[right], storage[child]):
+                    child = right
+            else:
+                for sibling in range(child + 1, min(child + arity, size)):
+                    if comparator(storage[sibling], storage[child]):
+                        child = sibling
+            if not comparator(storage[child], value):
+                break
+            storage[index] = storage[child]
+            index = child
+        storage[index] = value
+
+
+class IndexedHeap(Heap):
+    """
+    A priority queue of handles, where each handle is any hashable
+    object identifying an item (a task id, say) and has a priority
+    that can be changed or removed in O(log n). `storage` holds
+    (priority, handle) pairs and `positions` maps each handle to
+    its index in `storage`; `_bubble_up` and `_sift_down` keep it
+    up to date as they move entries. `comparator` compares
+    priorities, exactly as it compares values in Heap.
+    """
+    def __init__(self, comparator=None, arity=2):
+        super().__init__(arity=arity)
+        self.priority_comparator = comparator or (lambda x, y: x > y)
+        self.comparator = lambda a, b: self.priority_comparator(a[0], b[0])
+        self.positions = {}
+
+    @classmethod
+    def from_iterable(cls, pairs, comparator=None, arity=2):
+        heap = cls(comparator, arity)
+        heap.insert_many(pairs)
+        return heap
+
+    def __contains__(self, handle):
+        return handle in self.positions
+
+    def contains(self, handle):
+        return handle in self.positions
+
+    def insert(self, handle, priority):
+        if handle in self.positions:
+            raise ValueError(f'{handle!r} is already in the heap')
+        self.positions[handle] = len(self.storage)
+        self.storage.append((priority, handle))
+        self._bubble_up(len(self.storage) - 1)
+
+    """
+    Inserts every (handle, priority) pair, rebuilding the heap with
+    `heapify` when the batch is large next to the heap. All the
+    handles are checked first, so a handle that is already in the
+    heap, or repeated in the batch, raises ValueError before any
+    pair is inserted.
+    """
+    def insert_many(self, pairs):
+        pairs = list(pairs)
+        seen = set()
+        for handle, _ in pairs:
+            if handle in self.positions or handle in seen:
+                raise ValueError(f'{handle!r} is already in the heap')
+            seen.add(handle)
+        total = len(self.storage) + len(pairs)
+        if len(pairs) * total.bit_length() <= total:
+            for handle, priority in pairs:
+                self.insert(handle, priority)
+            return
+        for handle, priority in pairs:
+            self.positions[handle] = len(self.storage)
+            self.storage.append((priority, handle))
+        self.heapify()
+
+    """
+    Removes the top handle and returns it as a (handle, priority)
+    pair, or returns None if the heap is empty.
+    """
+    def delete(self):
+        if not self.storage:
+            return None
+        priority, handle = self.storage[0]
+        self.remove(handle)
+        return handle, priority
+
+    """
+    Removes the top handle and inserts `handle` with `priority` in
+    its place, returning the old top as a (handle, priority) pair.
+    """
+    def replace(self, handle, priority):
+        if not self.storage:
+            self.insert(handle, priority)
+            return None
+        top = self.delete()
+        self.insert(handle, priority)
+        return top
+
+    """
+    Returns the top (handle, priority) pair without removing it.
+    """
+    def get_priority(self):
+        if not self.storage:
+            return None
+        priority, handle = self.storage[0]
+        return handle, priority
+
+    """
+    Returns the handle's current priority.
+    """
+    def priority_of(self, handle):
+        return self.storage[self.positions[handle]][0]
+
+    """
+    Changes the handle's priority and moves it up or down to match.
+    """
+    def update(self, handle, priority):
+        index = self.positions[handle]
+        old_priority = self.storage[index][0]
+        self.storage[index] = (priority, handle)
+        if self.priority_comparator(priority, old_priority):
+            self._bubble_up(index)
+        else:
+            self._sift_down(index)
+
+    """
+    Removes the handle from the heap and returns its priority.
+    """
+    def remove(self, handle):
+        index = self.positions.pop(handle)
+        priority = self.storage[index][0]
+        last = self.storage.pop()
+        if index < len(self.storage):
+            self.storage[index] = last
+            self.positions[last[1]] = index
+            self._bubble_up(index)
+            self._sift_down(self.positions[last[1]])
+        return priority
 
     def _bubble_up(self, index):
-        pass
+        storage = self.storage
+        positions = self.positions
+        comparator = self.comparator
+        arity = self.arity
+        entry = storage[index]
+        while index > 0:
+            parent = (index - 1) // arity
+            if not comparator(entry, storage[parent]):
+                break
+            storage[index] = storage[parent]
+            positions[storage[index][1]] = index
+            index = parent
+        storage[index] = entry
+        positions[entry[1]] = index
 
     def _sift_down(self, index):
-        pass
+        storage = self.storage
+        positions = self.positions
+        comparator = self.comparator
+        arity = self.arity
+        size = len(storage)
+        entry = storage[index]
+        while True:
+            child = arity * index + 1
+            if child >= size:
+                break
+            if arity == 2:
+                # The binary case is common enough to skip the loop.
+                right = child + 1
+                if right < size and comparator(storage[right], storage[child]):
+                    child = right
+            else:
+                for sibling in range(child + 1, min(child + arity, size)):
+                    if comparator(storage[sibling], storage[child]):
+                        child = sibling
+            if not comparator(storage[child], entry):
+                break
+            storage[index] = storage[child]
+            positions[storage[index][1]] = index
+            index = child
+        storage[index] = entry
+        positions[entry[1]] = index
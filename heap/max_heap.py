@@ -1,21 +1,106 @@
 class Heap:
-    def __init__(self):
+    """
+    `arity` is how many children each node has. The default binary
+    layout puts the children of index i at 2i + 1 and 2i + 2; in
+    general they are at d*i + 1 through d*i + d. A wider heap is
+    shallower, so `delete` sifts through fewer levels and touches
+    neighbouring slots, at the cost of more comparisons per level.
+    """
+    def __init__(self, arity=2):
+        if arity < 2:
+            raise ValueError('arity must be at least 2')
         self.storage = []
+        self.arity = arity
+
+    """
+    Builds a heap out of all the given values at once, using
+    Floyd's bottom-up construction, which is O(n) rather than the
+    O(n log n) of inserting them one at a time.
+    """
+    @classmethod
+    def from_iterable(cls, values, arity=2):
+        heap = cls(arity)
+        heap.storage = list(values)
+        heap.heapify()
+        return heap
 
     def insert(self, value):
-        pass
+        self.storage.append(value)
+        self._bubble_up(len(self.storage) - 1)
+
+    """
+    Inserts every value in `values`. For a batch of k values going
+    into a heap of n, the values are appended and the whole heap is
+    rebuilt with `heapify` when k * log(n + k) > n + k, where that
+    beats bubbling each value up.
+    """
+    def insert_many(self, values):
+        values = list(values)
+        total = len(self.storage) + len(values)
+        if len(values) * total.bit_length() > total:
+            self.storage.extend(values)
+            self.heapify()
+        else:
+            for value in values:
+                self.insert(value)
 
     def delete(self):
-        pass
+        storage = self.storage
+        if not storage:
+            return None
+        last = storage.pop()
+        if not storage:
+            return last
+        top = storage[0]
+        storage[0] = last
+        self._sift_down(0)
+        return top
 
     def get_max(self):
-        pass
+        return self.storage[0] if self.storage else None
 
     def get_size(self):
-        pass
+        return len(self.storage)
+
+    """
+    Restores the heap property over the whole of `storage` by
+    sifting down every parent, starting from the last one.
+    """
+    def heapify(self):
+        for index in range((len(self.storage) - 2) // self.arity, -1, -1):
+            self._sift_down(index)
 
     def _bubble_up(self, index):
-        pass
+        storage = self.storage
+        arity = self.arity
+        value = storage[index]
+        while index > 0:
+            parent = (index - 1) // arity
+            if value <= storage[parent]:
+                break
+            storage[index] = storage[parent]
+            index = parent
+        storage[index] = value
 
     def _sift_down(self, index):
-        pass
+        storage = self.storage
+        arity = self.arity
+        size = len(storage)
+        value = storage[index]
+        while True:
+            child = arity * index + 1
+            if child >= size:
+                break
+            if arity == 2:
+                # The binary case is common enough to skip the loop.
+                if child + 1 < size and storage[child + 1] > storage[child]:
+                    child += 1
+            else:
+                for sibling in range(child + 1, min(child + arity, size)):
+                    if storage[sibling] > storage[child]:
+                        child = sibling
+            if storage[child] <= value:
+                break
+            storage[index] = storage[child]
+            index = child
+        storage[index] = value
@@ -0,0 +1,61 @@
+import operator
+
+from generic_heap import Heap
+
+
+def _identity(value):
+    return value
+
+
+"""
+Yields the `k` largest items of `iterable`, largest first, by
+`key(item)` if given. Only a min heap of the best `k` items seen so
+far is kept, so this is O(n log k) time and O(k) memory however
+long the stream is. Equal items come out in the order they arrived,
+and the earliest ones are kept when ties straddle the cut-off.
+"""
+def top_k(iterable, k, key=None):
+    if k <= 0:
+        return
+    key = key or _identity
+    # Entries are (key, -arrival, item): the root is the weakest
+    # item kept, and of equal keys the latest, which goes first.
+    heap = Heap(operator.lt)
+    storage = heap.storage
+    for arrival, item in enumerate(iterable):
+        item_key = key(item)
+        if len(storage) < k:
+            heap.insert((item_key, -arrival, item))
+        elif storage[0][0] < item_key:
+            heap.replace((item_key, -arrival, item))
+    for entry in sorted(storage, reverse=True):
+        yield entry[2]
+
+
+"""
+Lazily merges iterables that are each already sorted by `key(item)`
+(or by the items themselves) into one sorted stream. The heap holds
+one entry per source that still has items, so memory is O(number
+of sources) and each item costs O(log sources). Equal items come
+out in the order of their sources.
+"""
+def merge_sorted(*iterables, key=None):
+    key = key or _identity
+    # Entries are (key, source, item, iterator); the source number
+    # is unique, so items and iterators are never compared.
+    heap = Heap(operator.lt)
+    entries = []
+    for source, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for item in iterator:
+            entries.append((key(item), source, item, iterator))
+            break
+    heap.insert_many(entries)
+    while heap.get_size():
+        _, source, item, iterator = heap.get_priority()
+        yield item
+        for item in iterator:
+            heap.replace((key(item), source, item, iterator))
+            break
+        else:
+            heap.delete()
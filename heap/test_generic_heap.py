@@ -135,6 +135,81 @@ class HeapTests(unittest.TestCase):
 
         self.assertEqual(ascending_order, [1, 2, 5, 5, 6, 7, 8, 10])
 
+    def test_from_iterable_with_comparator(self):
+        values = [6, 7, 5, 8, 10, 1, 2, 5]
+        self.heap = Heap.from_iterable(values, lambda x, y: x < y)
+        self.assertEqual(self.heap.get_priority(), 1)
+
+        ascending_order = []
+        while self.heap.get_size() > 0:
+            ascending_order.append(self.heap.delete())
+        self.assertEqual(ascending_order, sorted(values))
+
+    def test_insert_many(self):
+        self.heap = Heap(lambda x, y: x < y)
+        self.heap.insert(4)
+        self.heap.insert_many([9, 0])
+        self.heap.insert_many(range(20, 0, -1))
+        self.assertEqual(self.heap.get_priority(), 0)
+
+        ascending_order = []
+        while self.heap.get_size() > 0:
+            ascending_order.append(self.heap.delete())
+        self.assertEqual(ascending_order, sorted([4, 9, 0] + list(range(1, 21))))
+
+    def test_d_ary_custom_heap(self):
+        values = [6, 7, 5, 8, 10, 1, 2, 5, 13, 0, 4, 4, 9]
+        for arity in (3, 4, 8):
+            self.heap = Heap(lambda x, y: x < y, arity=arity)
+            self.heap.insert_many(values[:2])
+            self.heap.insert_many(values[2:])
+            ascending_order = []
+            while self.heap.get_size() > 0:
+                ascending_order.append(self.heap.delete())
+            self.assertEqual(ascending_order, sorted(values))
+
+    def test_key_heap_orders_by_key(self):
+        words = ['pear', 'fig', 'banana', 'kiwi', 'apple']
+        self.heap = Heap(key=len)
+        for word in words:
+            self.heap.insert(word)
+        self.assertEqual(self.heap.get_priority(), 'banana')
+
+        order = []
+        while self.heap.get_size() > 0:
+            order.append(self.heap.delete())
+        self.assertEqual(order, ['banana', 'apple', 'pear', 'kiwi', 'fig'])
+
+    def test_key_min_heap_is_fifo_for_equal_keys(self):
+        tasks = [(2, 'a'), (1, 'b'), (2, 'c'), (1, 'd'), (0, 'e'), (1, 'f')]
+        self.heap = Heap.from_iterable(tasks, key=lambda task: task[0],
+                                       min_heap=True, arity=4)
+        self.heap.insert_many([(1, 'g'), (0, 'h')])
+        order = []
+        while self.heap.get_size() > 0:
+            order.append(self.heap.delete()[1])
+        self.assertEqual(order, ['e', 'h', 'b', 'd', 'f', 'g', 'a', 'c'])
+
+    def test_key_values_are_never_compared(self):
+        self.heap = Heap(key=lambda value: value['priority'])
+        self.heap.insert({'priority': 1, 'name': 'x'})
+        self.heap.insert({'priority': 1, 'name': 'y'})
+        self.assertEqual(self.heap.delete()['name'], 'x')
+
+    def test_replace_swaps_the_top(self):
+        self.assertIsNone(self.heap.replace(4))
+        self.heap.insert_many([9, 2, 7])
+        self.assertEqual(self.heap.replace(1), 9)
+        self.assertEqual(self.heap.storage[0], 7)
+        self.heap = Heap(key=len, min_heap=True)
+        self.heap.insert_many(['ccc', 'a', 'bb'])
+        self.assertEqual(self.heap.replace('dddd'), 'a')
+        self.assertEqual(self.heap.get_priority(), 'bb')
+
+    def test_key_and_comparator_are_exclusive(self):
+        with self.assertRaises(ValueError):
+            Heap(lambda x, y: x < y, key=len)
+
     def test_bubble_up_was_called(self):
         self.heap._bubble_up = MagicMock()
         self.heap.insert(5)
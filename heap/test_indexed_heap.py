@@ -0,0 +1,100 @@
+import random
+import unittest
+from generic_heap import IndexedHeap
+
+
+class IndexedHeapTests(unittest.TestCase):
+    def setUp(self):
+        self.heap = IndexedHeap()
+
+    def assertPositionsConsistent(self):
+        self.assertEqual(len(self.heap.positions), len(self.heap.storage))
+        for index, (_, handle) in enumerate(self.heap.storage):
+            self.assertEqual(self.heap.positions[handle], index)
+
+    def test_insert_and_delete_in_priority_order(self):
+        for handle, priority in [('a', 6), ('b', 8), ('c', 10), ('d', 1)]:
+            self.heap.insert(handle, priority)
+        self.assertPositionsConsistent()
+        self.assertEqual(self.heap.get_priority(), ('c', 10))
+        self.assertEqual(self.heap.delete(), ('c', 10))
+        self.assertEqual(self.heap.delete(), ('b', 8))
+        self.assertFalse(self.heap.contains('b'))
+        self.assertPositionsConsistent()
+
+    def test_duplicate_handle(self):
+        self.heap.insert('a', 1)
+        with self.assertRaises(ValueError):
+            self.heap.insert('a', 2)
+
+    def test_insert_many_rejects_duplicates_before_inserting(self):
+        self.heap.insert('a', 1)
+        with self.assertRaises(ValueError):
+            self.heap.insert_many([('b', 5), ('c', 9), ('a', 3)])
+        with self.assertRaises(ValueError):
+            self.heap.insert_many([('b', 5), ('b', 9)])
+        self.assertEqual(self.heap.get_size(), 1)
+        self.assertPositionsConsistent()
+        self.heap.insert_many([('b', 5), ('c', 9)])
+        self.assertEqual(self.heap.delete(), ('c', 9))
+        self.assertEqual(self.heap.delete(), ('b', 5))
+        self.assertEqual(self.heap.delete(), ('a', 1))
+
+    def test_update(self):
+        for i in range(10):
+            self.heap.insert(i, i)
+        self.heap.update(0, 100)
+        self.assertEqual(self.heap.get_priority(), (0, 100))
+        self.heap.update(0, -1)
+        self.assertEqual(self.heap.get_priority(), (9, 9))
+        self.assertEqual(self.heap.priority_of(0), -1)
+        self.assertPositionsConsistent()
+
+    def test_replace(self):
+        self.heap.insert('a', 5)
+        self.heap.insert('b', 3)
+        self.assertEqual(self.heap.replace('c', 1), ('a', 5))
+        self.assertEqual(self.heap.get_priority(), ('b', 3))
+        self.assertNotIn('a', self.heap)
+        self.assertEqual(self.heap.priority_of('c'), 1)
+        self.assertPositionsConsistent()
+
+    def test_remove(self):
+        for i in range(10):
+            self.heap.insert(i, i)
+        self.assertEqual(self.heap.remove(4), 4)
+        self.assertEqual(self.heap.remove(9), 9)
+        self.assertNotIn(4, self.heap)
+        self.assertPositionsConsistent()
+        order = []
+        while self.heap.get_size() > 0:
+            order.append(self.heap.delete()[0])
+        self.assertEqual(order, [8, 7, 6, 5, 3, 2, 1, 0])
+
+    def test_min_heap_random_operations(self):
+        for arity in (2, 4):
+            self._check_random_operations(arity)
+
+    def _check_random_operations(self, arity):
+        rng = random.Random(7)
+        heap = IndexedHeap.from_iterable(((i, rng.random()) for i in range(200)),
+                                         lambda x, y: x < y, arity)
+        expected = {i: heap.priority_of(i) for i in range(200)}
+        for _ in range(300):
+            handle = rng.randrange(200)
+            if handle in expected and rng.random() < 0.3:
+                heap.remove(handle)
+                del expected[handle]
+            elif handle in expected:
+                expected[handle] = rng.random()
+                heap.update(handle, expected[handle])
+        self.heap = heap
+        self.assertPositionsConsistent()
+        order = []
+        while heap.get_size() > 0:
+            order.append(heap.delete())
+        self.assertEqual(order, sorted(expected.items(), key=lambda p: p[1]))
+
+
+if __name__ == '__main__':
+    unittest.main()
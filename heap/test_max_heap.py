@@ -67,6 +67,53 @@ class HeapTests(unittest.TestCase):
 
         self.assertEqual(descending_order, [10, 8, 7, 6, 5, 5, 2, 1])
 
+    def test_from_iterable_builds_valid_heap(self):
+        values = [6, 7, 5, 8, 10, 1, 2, 5]
+        self.heap = Heap.from_iterable(values)
+        self.assertEqual(self.heap.get_size(), 8)
+        self.assertEqual(self.heap.get_max(), 10)
+        storage = self.heap.storage
+        for i in range(1, len(storage)):
+            self.assertGreaterEqual(storage[(i - 1) // 2], storage[i])
+
+        descending_order = []
+        while self.heap.get_size() > 0:
+            descending_order.append(self.heap.delete())
+        self.assertEqual(descending_order, sorted(values, reverse=True))
+
+    def test_insert_many(self):
+        self.heap.insert(4)
+        self.heap.insert_many([9, 1])
+        self.heap.insert_many(range(20, 0, -1))
+        self.assertEqual(self.heap.get_size(), 23)
+
+        descending_order = []
+        while self.heap.get_size() > 0:
+            descending_order.append(self.heap.delete())
+        self.assertEqual(descending_order,
+                         sorted([4, 9, 1] + list(range(1, 21)), reverse=True))
+
+    def test_d_ary_heaps_delete_in_order(self):
+        values = [6, 7, 5, 8, 10, 1, 2, 5, 13, 0, 4, 4, 9]
+        for arity in (3, 4, 8):
+            heap = Heap(arity)
+            for value in values:
+                heap.insert(value)
+            storage = heap.storage
+            for i in range(1, len(storage)):
+                self.assertGreaterEqual(storage[(i - 1) // arity], storage[i])
+
+            bulk = Heap.from_iterable(values, arity)
+            for h in (heap, bulk):
+                descending_order = []
+                while h.get_size() > 0:
+                    descending_order.append(h.delete())
+                self.assertEqual(descending_order, sorted(values, reverse=True))
+
+    def test_invalid_arity(self):
+        with self.assertRaises(ValueError):
+            Heap(1)
+
     def test_bubble_up_was_called(self):
         self.heap._bubble_up = MagicMock()
         self.heap.insert(5)
@@ -0,0 +1,57 @@
+import random
+import unittest
+from streaming import top_k, merge_sorted
+
+
+class TopKTests(unittest.TestCase):
+    def test_top_k_matches_sorting(self):
+        values = [random.randrange(1000) for _ in range(500)]
+        self.assertEqual(list(top_k(values, 10)),
+                         sorted(values, reverse=True)[:10])
+
+    def test_top_k_reads_a_stream_once(self):
+        self.assertEqual(list(top_k(iter(range(100000)), 3)),
+                         [99999, 99998, 99997])
+
+    def test_top_k_with_key_keeps_earliest_ties(self):
+        words = ['bb', 'a', 'cc', 'ddd', 'ee', 'f']
+        self.assertEqual(list(top_k(words, 3, key=len)), ['ddd', 'bb', 'cc'])
+
+    def test_top_k_edge_sizes(self):
+        self.assertEqual(list(top_k([3, 1, 2], 0)), [])
+        self.assertEqual(list(top_k([3, 1, 2], 5)), [3, 2, 1])
+        self.assertEqual(list(top_k([], 5)), [])
+
+
+class MergeSortedTests(unittest.TestCase):
+    def test_merge_sorted_matches_sorting(self):
+        sources = [sorted(random.randrange(100) for _ in range(n))
+                   for n in (0, 1, 7, 50, 20)]
+        self.assertEqual(list(merge_sorted(*sources)),
+                         sorted(v for source in sources for v in source))
+
+    def test_merge_sorted_is_lazy(self):
+        def evens():
+            n = 0
+            while True:
+                yield n
+                n += 2
+        merged = merge_sorted(evens(), iter([1, 3, 5]))
+        self.assertEqual([next(merged) for _ in range(8)],
+                         [0, 1, 2, 3, 4, 5, 6, 8])
+
+    def test_merge_sorted_with_key_is_stable(self):
+        first = [(1, 'a'), (3, 'a')]
+        second = [(1, 'b'), (2, 'b'), (3, 'b')]
+        merged = merge_sorted(first, second, key=lambda pair: pair[0])
+        self.assertEqual(list(merged),
+                         [(1, 'a'), (1, 'b'), (2, 'b'), (3, 'a'), (3, 'b')])
+
+    def test_merge_sorted_never_compares_items(self):
+        merged = merge_sorted([{'t': 1}, {'t': 1}], [{'t': 1}],
+                              key=lambda row: row['t'])
+        self.assertEqual(len(list(merged)), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,79 @@
+"""
+Replays access traces against LRUCache and the scan-resistant
+caches and prints each policy's hit rate. On a miss the key is
+set, as a read-through cache would do.
+
+    python benchmark_hit_rate.py [--limit N] [trace_file ...]
+
+A trace file holds one key per line. Without trace files a
+synthetic trace is generated: skewed reads over a hot working
+set, interrupted by sequential scans over cold keys. The hot set
+is twice the default limit, so hot keys keep falling out of the
+cache and coming back; that is how 2Q and ARC learn which keys
+are hot. With a hot set that fits in the cache, 2Q never sees a
+hot key come back before a scan flushes it, and scores the same
+as LRU.
+"""
+import argparse
+import random
+
+from lru_cache import LRUCache
+from scan_resistant_cache import ARCCache, TinyLFUCache, TwoQueueCache
+
+POLICIES = [
+    ('LRU', LRUCache),
+    ('2Q', TwoQueueCache),
+    ('ARC', ARCCache),
+    ('W-TinyLFU', TinyLFUCache),
+]
+
+
+def synthetic_trace(length=200000, hot_keys=1000, scan_every=5000,
+                    scan_length=2000, seed=42):
+    rng = random.Random(seed)
+    trace = []
+    scan_start = hot_keys
+    while len(trace) < length:
+        for _ in range(scan_every):
+            # Squaring a uniform sample skews reads towards low keys.
+            trace.append(int(hot_keys * rng.random() ** 2))
+        trace.extend(range(scan_start, scan_start + scan_length))
+        scan_start += scan_length
+    return trace[:length]
+
+
+def read_trace(path):
+    with open(path) as trace_file:
+        return [line.strip() for line in trace_file if line.strip()]
+
+
+def hit_rate(cache, trace):
+    missing = object()
+    hits = 0
+    for key in trace:
+        if cache.get(key, missing) is missing:
+            cache.set(key, key)
+        else:
+            hits += 1
+    return hits / len(trace)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--limit', type=int, default=500)
+    parser.add_argument('traces', nargs='*')
+    args = parser.parse_args()
+
+    traces = [(path, read_trace(path)) for path in args.traces]
+    if not traces:
+        traces = [('synthetic', synthetic_trace())]
+
+    for name, trace in traces:
+        print(f'{name}: {len(trace)} accesses, limit {args.limit}')
+        for policy, cache_class in POLICIES:
+            rate = hit_rate(cache_class(args.limit), trace)
+            print(f'  {policy:<10} {rate:7.2%}')
+
+
+if __name__ == '__main__':
+    main()
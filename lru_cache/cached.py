@@ -0,0 +1,163 @@
+import asyncio
+import functools
+import inspect
+import threading
+from collections import namedtuple
+
+from lru_cache import LRUCache
+
+CacheInfo = namedtuple(
+    'CacheInfo', ['hits', 'misses', 'evictions', 'coalesced', 'currsize', 'limit'])
+
+_MISSING = object()
+
+
+def _make_key(args, kwargs):
+    if kwargs:
+        return args + (_MISSING,) + tuple(sorted(kwargs.items()))
+    return args
+
+
+class _Flight:
+    """
+    A computation that is currently running for one key. Callers
+    that miss on the same key wait for it instead of running the
+    function again.
+    """
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class _Memo:
+    """
+    The state shared by one decorated function: its LRUCache, the
+    in-flight computations and the counters behind `cache_info`.
+    """
+    def __init__(self, limit, ttl):
+        self.cache = LRUCache(limit, ttl=ttl)
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+    """
+    Returns the cached value for the key, or _MISSING. Must be
+    called with the lock held.
+    """
+    def lookup(self, key):
+        value = self.cache.get(key, _MISSING)
+        if value is not _MISSING:
+            self.hits += 1
+        return value
+
+    """
+    Stores a freshly computed value. Must be called with the
+    lock held.
+    """
+    def store(self, key, value):
+        self.cache.set(key, value)
+
+    def info(self):
+        with self.lock:
+            return CacheInfo(self.hits, self.misses, self.cache.evictions,
+                             self.coalesced, len(self.cache),
+                             self.cache.limit)
+
+    def clear(self):
+        with self.lock:
+            self.cache = LRUCache(self.cache.limit, ttl=self.cache.ttl)
+            self.hits = self.misses = self.coalesced = 0
+
+
+def _wrap_sync(func, memo):
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        key = _make_key(args, kwargs)
+        with memo.lock:
+            value = memo.lookup(key)
+            if value is not _MISSING:
+                return value
+            flight = memo.in_flight.get(key)
+            leader = flight is None
+            if leader:
+                flight = memo.in_flight[key] = _Flight()
+                memo.misses += 1
+            else:
+                memo.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.result
+
+        try:
+            flight.result = func(*args, **kwargs)
+        except BaseException as error:
+            flight.error = error
+            raise
+        finally:
+            with memo.lock:
+                if flight.error is None:
+                    memo.store(key, flight.result)
+                del memo.in_flight[key]
+            flight.done.set()
+        return flight.result
+
+    return wrapper
+
+
+def _wrap_async(func, memo):
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        key = _make_key(args, kwargs)
+        # A task can only be awaited from its own event loop, so
+        # callers running other loops (in other threads) each get
+        # their own computation rather than joining this one.
+        flight_key = (asyncio.get_running_loop(), key)
+        with memo.lock:
+            value = memo.lookup(key)
+            if value is not _MISSING:
+                return value
+            task = memo.in_flight.get(flight_key)
+            if task is None:
+                task = asyncio.ensure_future(func(*args, **kwargs))
+                memo.in_flight[flight_key] = task
+                memo.misses += 1
+
+                def finish(task):
+                    with memo.lock:
+                        if not task.cancelled() and task.exception() is None:
+                            memo.store(key, task.result())
+                        del memo.in_flight[flight_key]
+                task.add_done_callback(finish)
+            else:
+                memo.coalesced += 1
+        # Shielding means a caller being cancelled only cancels its
+        # own wait, never the computation the other callers share.
+        return await asyncio.shield(task)
+
+    return wrapper
+
+
+"""
+Memoizes a function in an LRUCache holding up to `limit` results,
+each expiring after `ttl` seconds if given. Works on plain and
+`async def` functions. Concurrent calls that miss on the same
+arguments share a single computation. The wrapper gains
+`cache_info()` and `cache_clear()`, like `functools.lru_cache`.
+"""
+def cached(limit=128, ttl=None):
+    def decorator(func):
+        memo = _Memo(limit, ttl)
+        if inspect.iscoroutinefunction(func):
+            wrapper = _wrap_async(func, memo)
+        else:
+            wrapper = _wrap_sync(func, memo)
+        wrapper.cache_info = memo.info
+        wrapper.cache_clear = memo.clear
+        return wrapper
+    return decorator
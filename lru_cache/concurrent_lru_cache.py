@@ -0,0 +1,98 @@
+import threading
+
+from lru_cache import LRUCache
+
+
+class ConcurrentLRUCache:
+    """
+    A thread-safe LRU cache that spreads its keys across a number
+    of independent LRUCache segments. Each segment has its own
+    lock, recency list and storage dict, so threads working on
+    keys in different segments never wait on each other. The
+    overall `limit` is divided between the segments, which means
+    eviction is least-recently used per segment rather than
+    across the whole cache. A `limit` of None leaves every segment
+    unbounded. `ttl` is passed on to every segment.
+    """
+    def __init__(self, limit=10, segments=16, ttl=None):
+        self.limit = limit
+        if limit is None:
+            limits = [None] * max(1, segments)
+        else:
+            segments = max(1, min(segments, limit))
+            base, extra = divmod(limit, segments)
+            limits = [base + (1 if i < extra else 0)
+                      for i in range(segments)]
+        self.segments = [LRUCache(segment_limit, ttl=ttl)
+                         for segment_limit in limits]
+        segments = len(self.segments)
+        self.locks = [threading.Lock() for _ in range(segments)]
+
+    def _segment_index(self, key):
+        return hash(key) % len(self.segments)
+
+    def __len__(self):
+        return sum(len(segment) for segment in self.segments)
+
+    def __contains__(self, key):
+        index = self._segment_index(key)
+        with self.locks[index]:
+            return key in self.segments[index]
+
+    """
+    Retrieves the value associated with the given key from the
+    key's segment, marking it as most-recently used there.
+    Returns `default` if the key isn't cached.
+    """
+    def get(self, key, default=None):
+        index = self._segment_index(key)
+        with self.locks[index]:
+            return self.segments[index].get(key, default)
+
+    """
+    Adds the given key-value pair to the key's segment, evicting
+    that segment's least-recently used entry if it is full.
+    """
+    def set(self, key, value, ttl=None):
+        index = self._segment_index(key)
+        with self.locks[index]:
+            self.segments[index].set(key, value, ttl)
+
+    """
+    Reaps expired entries one segment at a time, holding only
+    that segment's lock. `budget` applies to each segment.
+    Returns the total number of entries removed.
+    """
+    def reap(self, budget=None):
+        removed = 0
+        for lock, segment in zip(self.locks, self.segments):
+            with lock:
+                removed += segment.reap(budget)
+        return removed
+
+    @property
+    def hits(self):
+        return sum(segment.hits for segment in self.segments)
+
+    @property
+    def misses(self):
+        return sum(segment.misses for segment in self.segments)
+
+    """
+    Adds up the counters, sizes and weights reported by each
+    segment's `stats()` into one snapshot for the whole cache.
+    """
+    def stats(self):
+        totals = {}
+        for lock, segment in zip(self.locks, self.segments):
+            with lock:
+                segment_stats = segment.stats()
+            for name in ('hits', 'misses', 'inserts', 'overwrites',
+                         'evictions', 'expirations', 'size',
+                         'total_weight'):
+                totals[name] = totals.get(name, 0) + segment_stats[name]
+        lookups = totals['hits'] + totals['misses']
+        totals['hit_rate'] = totals['hits'] / lookups if lookups else None
+        totals['limit'] = self.limit
+        totals['segments'] = len(self.segments)
+        return totals
@@ -1,3 +1,66 @@
+import heapq
+import itertools
+import mmap
+import os
+import pickle
+import struct
+import threading
+import time
+
+from doubly_linked_list import DoublyLinkedList
+
+# Snapshot files start with this magic string and a version byte,
+# followed by an entry count and then one length-prefixed pickled
+# (key, value, remaining_ttl) tuple per entry, least-recently used
+# first.
+SNAPSHOT_MAGIC = b'LRUSNAP'
+SNAPSHOT_VERSION = 1
+SNAPSHOT_HEADER = struct.Struct('<7sBQ')
+SNAPSHOT_LENGTH = struct.Struct('<I')
+
+
+class LatencyHistogram:
+    """
+    Counts durations in power-of-two nanosecond buckets: bucket
+    `i` holds durations of at least 2**(i-1) and less than 2**i
+    nanoseconds. Recording is one `bit_length` and one increment.
+    """
+    def __init__(self):
+        self.buckets = [0] * 64
+        self.count = 0
+        self.total_ns = 0
+
+    def record(self, duration_ns):
+        self.buckets[min(duration_ns.bit_length(), 63)] += 1
+        self.count += 1
+        self.total_ns += duration_ns
+
+    """
+    Returns the upper bound, in nanoseconds, of the bucket that
+    holds the given percentile, or None if nothing was recorded.
+    """
+    def percentile(self, percent):
+        if not self.count:
+            return None
+        threshold = self.count * percent / 100
+        seen = 0
+        for i, bucket in enumerate(self.buckets):
+            seen += bucket
+            if seen >= threshold:
+                return 1 << i
+        return 1 << 63
+
+    def snapshot(self):
+        return {
+            'count': self.count,
+            'mean_ns': self.total_ns / self.count if self.count else None,
+            'p50_ns': self.percentile(50),
+            'p99_ns': self.percentile(99),
+            'buckets': {1 << i: bucket
+                        for i, bucket in enumerate(self.buckets) if bucket},
+        }
+
+
 class LRUCache:
     """
     Our LRUCache class keeps track of the max number of nodes it
@@ -5,19 +68,103 @@ class LRUCache:
     linked list that holds the key-value entries in the correct
     order, as well as a storage dict that provides fast access
     to every node stored in the cache.
+
+    Passing `max_weight` additionally bounds the cache by the
+    total weight of its entries, as reported by `weigher(key,
+    value)` (every entry weighs 1 if no weigher is given). Either
+    bound can be switched off by passing None for it.
+
+    Passing `ttl` makes entries expire that many seconds after
+    they were last set. Expired entries are treated as misses
+    and unlinked when they are next looked up, or in batches by
+    `reap`.
+
+    The cache always counts hits, misses, inserts, overwrites,
+    evictions and expirations. `on_evict(key, value, reason)` is
+    called for every entry pushed out to make room (reason
+    'evicted') or dropped because it expired ('expired'). With
+    `record_latency` the time spent in `get` and `set` is also
+    collected into histograms. `stats()` returns all of it.
     """
-    def __init__(self, limit=10):
-        pass
+    def __init__(self, limit=10, max_weight=None, weigher=None,
+                 ttl=None, clock=time.monotonic, on_evict=None,
+                 record_latency=False):
+        self.limit = limit
+        self.size = 0
+        self.max_weight = max_weight
+        self.weigher = weigher
+        self.total_weight = 0
+        self.ttl = ttl
+        self.clock = clock
+        # The head of the list is the least-recently used entry and
+        # the tail is the most-recently used one. Each node holds a
+        # (key, value, weight, expires_at) tuple so evictions know
+        # which key to drop and how much weight they free up.
+        self.order = DoublyLinkedList()
+        self.storage = {}
+        # A min-heap of (expires_at, seq, key) used by `reap`. Entries
+        # aren't removed from it when a key is overwritten or evicted;
+        # `reap` skips them when their expiry no longer matches.
+        self.expiry_heap = []
+        self.expiry_seq = itertools.count()
+        self.on_evict = on_evict
+        self.hits = 0
+        self.misses = 0
+        self.inserts = 0
+        self.overwrites = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.get_latency = None
+        self.set_latency = None
+        if record_latency:
+            # Timing wrappers shadow the methods on this instance
+            # only, so caches without them pay nothing.
+            self.get_latency = LatencyHistogram()
+            self.set_latency = LatencyHistogram()
+            self.get = self._timed(type(self).get, self.get_latency)
+            self.set = self._timed(type(self).set, self.set_latency)
+
+    def _timed(self, method, histogram):
+        perf_counter_ns = time.perf_counter_ns
+
+        def timed(*args, **kwargs):
+            start = perf_counter_ns()
+            try:
+                return method(self, *args, **kwargs)
+            finally:
+                histogram.record(perf_counter_ns() - start)
+        return timed
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, key):
+        node = self.storage.get(key)
+        return node is not None and not self._expired(node)
+
+    def _expired(self, node):
+        expires_at = node.value[3]
+        return expires_at is not None and expires_at <= self.clock()
 
     """
     Retrieves the value associated with the given key. Also
     needs to move the key-value pair to the end of the order
     such that the pair is considered most-recently used.
-    Returns the value associated with the key or None if the
-    key-value pair doesn't exist in the cache.
+    Returns the value associated with the key or `default` if the
+    key-value pair doesn't exist in the cache or has expired.
     """
-    def get(self, key):
-        pass
+    def get(self, key, default=None):
+        node = self.storage.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        if self._expired(node):
+            self._expire(key)
+            self.misses += 1
+            return default
+        self.hits += 1
+        self.order.move_to_end(node)
+        return node.value[1]
 
     """
     Adds the given key-value pair to the cache. The newly-
@@ -27,7 +174,251 @@ class LRUCache:
     cache needs to be removed to make room. Additionally, in the
     case that the key already exists in the cache, we simply
     want to overwrite the old value associated with the key with
-    the newly-specified value.
+    the newly-specified value. `ttl` overrides the cache's
+    default time-to-live for this entry.
+    A value heavier than `max_weight` is not cached. Any entry the
+    key already had is still dropped, since it no longer holds the
+    key's latest value, and is reported as an eviction.
+    """
+    def set(self, key, value, ttl=None):
+        if ttl is None:
+            ttl = self.ttl
+        self._store(key, value, ttl)
+
+    """
+    Does the work of `set` with `ttl` already resolved, so None
+    means the entry never expires. `load` uses it with `restoring`
+    set, which leaves the insert and overwrite counters alone.
+    """
+    def _store(self, key, value, ttl, restoring=False):
+        weight = 1 if self.weigher is None else self.weigher(key, value)
+        if self.max_weight is not None and weight > self.max_weight:
+            # The entry could never fit, so don't flush the whole
+            # cache trying to make room for it.
+            node = self.storage.get(key)
+            if node is not None:
+                self.remove(key)
+                self._evicted(key, node.value[1])
+            return
+
+        expires_at = None
+        if ttl is not None:
+            expires_at = self.clock() + ttl
+            self._schedule_expiry(expires_at, key)
+
+        node = self.storage.get(key)
+        if node is not None:
+            self.total_weight += weight - node.value[2]
+            node.value = (key, value, weight, expires_at)
+            self.order.move_to_end(node)
+            if not restoring:
+                self.overwrites += 1
+        else:
+            self.order.add_to_tail((key, value, weight, expires_at))
+            self.storage[key] = self.order.tail
+            self.size += 1
+            self.total_weight += weight
+            if not restoring:
+                self.inserts += 1
+        self._evict()
+
+    """
+    Removes the given key from the cache if it is present.
+    Returns True if an entry was removed.
+    """
+    def remove(self, key):
+        node = self.storage.pop(key, None)
+        if node is None:
+            return False
+        self.order.delete(node)
+        self.size -= 1
+        self.total_weight -= node.value[2]
+        return True
+
+    """
+    Evicts least-recently used entries until the cache is back
+    within its limit and its max weight.
+    """
+    def _evict(self):
+        while ((self.limit is not None and self.size > self.limit) or
+               (self.max_weight is not None and
+                self.total_weight > self.max_weight)):
+            oldest_key, value, weight, _ = self.order.remove_from_head()
+            del self.storage[oldest_key]
+            self.size -= 1
+            self.total_weight -= weight
+            self._evicted(oldest_key, value)
+
+    def _evicted(self, key, value):
+        self.evictions += 1
+        if self.on_evict is not None:
+            self.on_evict(key, value, 'evicted')
+
+    def _expire(self, key):
+        value = self.storage[key].value[1]
+        self.remove(key)
+        self.expirations += 1
+        if self.on_evict is not None:
+            self.on_evict(key, value, 'expired')
+
+    def _schedule_expiry(self, expires_at, key):
+        heap = self.expiry_heap
+        # Drop the outdated heap entries once they clearly outnumber
+        # the live ones, so overwrites can't grow the heap forever.
+        if len(heap) > 2 * self.size + 64:
+            heap[:] = [(node.value[3], next(self.expiry_seq), k)
+                       for k, node in self.storage.items()
+                       if node.value[3] is not None]
+            heapq.heapify(heap)
+        heapq.heappush(heap, (expires_at, next(self.expiry_seq), key))
+
+    """
+    Removes expired entries in order of expiry, stopping at the
+    first entry that is still live or after looking at `budget`
+    heap entries, so the work done per call is bounded. Returns
+    the number of entries that were removed.
+    """
+    def reap(self, budget=None):
+        heap = self.expiry_heap
+        now = self.clock()
+        removed = 0
+        examined = 0
+        while heap and heap[0][0] <= now:
+            if budget is not None and examined >= budget:
+                break
+            expires_at, _, key = heapq.heappop(heap)
+            examined += 1
+            node = self.storage.get(key)
+            if node is not None and node.value[3] == expires_at:
+                self._expire(key)
+                removed += 1
+        return removed
+
+    """
+    Returns a plain dict snapshot of the cache's counters, its
+    current size and weight, and its latency histograms if they
+    are being recorded, ready to be logged or exported.
     """
-    def set(self, key, value):
-        pass
+    def stats(self):
+        lookups = self.hits + self.misses
+        stats = {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else None,
+            'inserts': self.inserts,
+            'overwrites': self.overwrites,
+            'evictions': self.evictions,
+            'expirations': self.expirations,
+            'size': self.size,
+            'limit': self.limit,
+            'total_weight': self.total_weight,
+            'max_weight': self.max_weight,
+        }
+        if self.get_latency is not None:
+            stats['get_latency'] = self.get_latency.snapshot()
+            stats['set_latency'] = self.set_latency.snapshot()
+        return stats
+
+    """
+    Writes every live entry to a snapshot file at `path`, least-
+    recently used first, so that `load` can restore the same
+    recency order. Expiry times are saved as time remaining. The
+    file is written next to `path` and moved into place, so a
+    crash mid-dump never leaves a truncated snapshot behind, and
+    a dump that fails (on an unpicklable value, say) removes its
+    partial file.
+    """
+    def dump(self, path):
+        tmp_path = f'{path}.tmp'
+        try:
+            self._write_snapshot(tmp_path)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+    def _write_snapshot(self, tmp_path):
+        now = self.clock()
+        count = 0
+        with open(tmp_path, 'wb') as snapshot:
+            # The count isn't known until the end, so the header is
+            # written again once all the entries are out.
+            snapshot.write(SNAPSHOT_HEADER.pack(
+                SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0))
+            for key, value, _, expires_at in self.order:
+                remaining = None
+                if expires_at is not None:
+                    remaining = expires_at - now
+                    if remaining <= 0:
+                        continue
+                entry = pickle.dumps((key, value, remaining),
+                                     pickle.HIGHEST_PROTOCOL)
+                snapshot.write(SNAPSHOT_LENGTH.pack(len(entry)))
+                snapshot.write(entry)
+                count += 1
+            snapshot.seek(0)
+            snapshot.write(SNAPSHOT_HEADER.pack(
+                SNAPSHOT_MAGIC, SNAPSHOT_VERSION, count))
+
+    """
+    Adds the entries of a snapshot written by `dump` to the cache,
+    restoring their recency order; they become more recently used
+    than anything already cached. Entries that had no expiry when
+    dumped get none now, whatever the cache's default `ttl`, and
+    restoring them doesn't count towards `inserts` or `overwrites`.
+    The file is memory-mapped and
+    each entry unpickled straight out of the mapping. Snapshots
+    are pickles, so only load files this process could trust.
+    Returns the number of entries read.
+    """
+    def load(self, path):
+        with open(path, 'rb') as snapshot, \
+                mmap.mmap(snapshot.fileno(), 0,
+                          access=mmap.ACCESS_READ) as mapped:
+            magic, version, count = SNAPSHOT_HEADER.unpack_from(mapped, 0)
+            if magic != SNAPSHOT_MAGIC or version != SNAPSHOT_VERSION:
+                raise ValueError(f'{path} is not an LRUCache snapshot')
+            view = memoryview(mapped)
+            try:
+                offset = SNAPSHOT_HEADER.size
+                for _ in range(count):
+                    length, = SNAPSHOT_LENGTH.unpack_from(mapped, offset)
+                    offset += SNAPSHOT_LENGTH.size
+                    key, value, remaining = pickle.loads(
+                        view[offset:offset + length])
+                    offset += length
+                    self._store(key, value, remaining, restoring=True)
+            finally:
+                view.release()
+        return count
+
+
+class Reaper(threading.Thread):
+    """
+    A daemon thread that calls `cache.reap(budget)` every
+    `interval` seconds until `stop` is called. LRUCache isn't
+    thread-safe by itself, so pass the `lock` that guards the
+    cache; ConcurrentLRUCache does its own locking and needs none.
+    """
+    def __init__(self, cache, interval=1.0, budget=None, lock=None):
+        super().__init__(daemon=True)
+        self.cache = cache
+        self.interval = interval
+        self.budget = budget
+        self.lock = lock
+        self.stopped = threading.Event()
+
+    def run(self):
+        while not self.stopped.wait(self.interval):
+            if self.lock is None:
+                self.cache.reap(self.budget)
+            else:
+                with self.lock:
+                    self.cache.reap(self.budget)
+
+    def stop(self):
+        self.stopped.set()
+        self.join()
@@ -0,0 +1,348 @@
+"""
+Caches that share LRUCache's `get`/`set` interface but use
+eviction policies that a single pass over many cold keys (a
+"scan") can't flush the hot working set out of. All of their
+recency queues are DoublyLinkedLists indexed by a dict, the same
+pairing LRUCache uses. As with LRUCache, a `limit` of 0 caches
+nothing.
+"""
+from array import array
+
+from doubly_linked_list import DoublyLinkedList
+
+
+class RecencyQueue:
+    """
+    A DoublyLinkedList of (key, value) pairs plus a dict from key
+    to node. The head is the least-recently used end and the tail
+    the most-recently used one.
+    """
+    def __init__(self):
+        self.order = DoublyLinkedList()
+        self.storage = {}
+
+    def __len__(self):
+        return len(self.storage)
+
+    def __contains__(self, key):
+        return key in self.storage
+
+    def get(self, key):
+        return self.storage[key].value[1]
+
+    """
+    Adds the key as the most-recently used entry.
+    """
+    def push(self, key, value=None):
+        self.order.add_to_tail((key, value))
+        self.storage[key] = self.order.tail
+
+    """
+    Overwrites the key's value and marks it most-recently used.
+    """
+    def update(self, key, value):
+        node = self.storage[key]
+        node.value = (key, value)
+        self.order.move_to_end(node)
+
+    def touch(self, key):
+        self.order.move_to_end(self.storage[key])
+
+    """
+    Removes the key and returns its value.
+    """
+    def remove(self, key):
+        node = self.storage.pop(key)
+        self.order.delete(node)
+        return node.value[1]
+
+    """
+    Removes the least-recently used entry and returns it as a
+    (key, value) pair.
+    """
+    def pop_oldest(self):
+        key, value = self.order.remove_from_head()
+        del self.storage[key]
+        return key, value
+
+    def oldest_key(self):
+        return self.order.head.value[0]
+
+
+class TwoQueueCache:
+    """
+    The full 2Q policy (Johnson & Shasha). New keys enter a small
+    FIFO, `recent`; when they fall out of it only their key is
+    remembered, in `ghosts`. A key that is set again while it is
+    remembered has proven itself and goes into the main LRU queue,
+    `frequent`. A scan therefore only churns `recent` and `ghosts`.
+    """
+    def __init__(self, limit=10, recent_ratio=0.25, ghost_ratio=0.5):
+        self.limit = limit
+        self.recent_limit = max(1, int(limit * recent_ratio))
+        self.ghost_limit = max(1, int(limit * ghost_ratio))
+        self.recent = RecencyQueue()
+        self.ghosts = RecencyQueue()
+        self.frequent = RecencyQueue()
+
+    def __len__(self):
+        return len(self.recent) + len(self.frequent)
+
+    def __contains__(self, key):
+        return key in self.recent or key in self.frequent
+
+    def get(self, key, default=None):
+        if key in self.frequent:
+            self.frequent.touch(key)
+            return self.frequent.get(key)
+        if key in self.recent:
+            # `recent` is a FIFO, so hits don't reorder it.
+            return self.recent.get(key)
+        return default
+
+    def set(self, key, value):
+        if key in self.frequent:
+            self.frequent.update(key, value)
+            return
+        if key in self.recent:
+            self.recent.storage[key].value = (key, value)
+            return
+        if self.limit <= 0:
+            return
+
+        if len(self) >= self.limit:
+            self._reclaim()
+        if key in self.ghosts:
+            self.ghosts.remove(key)
+            self.frequent.push(key, value)
+        else:
+            self.recent.push(key, value)
+
+    def _reclaim(self):
+        if len(self.recent) > self.recent_limit or not self.frequent:
+            key, _ = self.recent.pop_oldest()
+            self.ghosts.push(key)
+            if len(self.ghosts) > self.ghost_limit:
+                self.ghosts.pop_oldest()
+        else:
+            self.frequent.pop_oldest()
+
+
+class ARCCache:
+    """
+    Adaptive Replacement Cache (Megiddo & Modha). `t1` holds keys
+    seen once recently and `t2` keys seen at least twice; `b1` and
+    `b2` remember the keys recently evicted from each. Setting a
+    key remembered in `b1` or `b2` shifts the target size `p` of
+    `t1` towards whichever list would have kept it, so the split
+    between recency and frequency adapts to the workload.
+    """
+    def __init__(self, limit=10):
+        self.limit = limit
+        self.p = 0
+        self.t1 = RecencyQueue()
+        self.t2 = RecencyQueue()
+        self.b1 = RecencyQueue()
+        self.b2 = RecencyQueue()
+
+    def __len__(self):
+        return len(self.t1) + len(self.t2)
+
+    def __contains__(self, key):
+        return key in self.t1 or key in self.t2
+
+    def get(self, key, default=None):
+        if key in self.t1:
+            value = self.t1.remove(key)
+            self.t2.push(key, value)
+            return value
+        if key in self.t2:
+            self.t2.touch(key)
+            return self.t2.get(key)
+        return default
+
+    def set(self, key, value):
+        if key in self.t1:
+            self.t1.remove(key)
+            self.t2.push(key, value)
+            return
+        if key in self.t2:
+            self.t2.update(key, value)
+            return
+        if self.limit <= 0:
+            return
+
+        c = self.limit
+        if key in self.b1:
+            delta = max(len(self.b2) // len(self.b1), 1)
+            self.p = min(c, self.p + delta)
+            self.b1.remove(key)
+            self._replace(in_b2=False)
+            self.t2.push(key, value)
+            return
+        if key in self.b2:
+            delta = max(len(self.b1) // len(self.b2), 1)
+            self.p = max(0, self.p - delta)
+            self.b2.remove(key)
+            self._replace(in_b2=True)
+            self.t2.push(key, value)
+            return
+
+        if len(self.t1) + len(self.b1) >= c:
+            if len(self.t1) < c:
+                self.b1.pop_oldest()
+                self._replace(in_b2=False)
+            else:
+                self.t1.pop_oldest()
+        else:
+            total = len(self.t1) + len(self.t2) + len(self.b1) + len(self.b2)
+            if total >= c:
+                if total >= 2 * c:
+                    self.b2.pop_oldest()
+                self._replace(in_b2=False)
+        self.t1.push(key, value)
+
+    """
+    Makes room for one entry by evicting from `t1` or `t2`,
+    depending on how `t1` compares to its target size, and
+    remembering the evicted key in the matching ghost list.
+    """
+    def _replace(self, in_b2):
+        if len(self) < self.limit:
+            return
+        t1_size = len(self.t1)
+        if t1_size and (t1_size > self.p or not self.t2 or
+                        (in_b2 and t1_size == self.p)):
+            key, _ = self.t1.pop_oldest()
+            self.b1.push(key)
+        else:
+            key, _ = self.t2.pop_oldest()
+            self.b2.push(key)
+
+
+class CountMinSketch:
+    """
+    Approximate access frequencies in a fixed amount of memory.
+    Each key maps to one counter per row and its estimate is the
+    smallest of those counters. Counters saturate at 15 and are
+    all halved once `sample_size` increments have been recorded,
+    so old popularity fades out.
+    """
+    DEPTH = 4
+    SEEDS = (0x9E3779B97F4A7C15, 0xC2B2AE3D27D4EB4F,
+             0x165667B19E3779F9, 0xD6E8FEB86659FD93)
+    MASK64 = (1 << 64) - 1
+
+    def __init__(self, width, sample_size):
+        self.width = 1
+        while self.width < width:
+            self.width <<= 1
+        self.table = array('B', bytes(self.width * self.DEPTH))
+        self.sample_size = sample_size
+        self.additions = 0
+
+    def _indexes(self, key):
+        h = hash(key)
+        width = self.width
+        for row, seed in enumerate(self.SEEDS):
+            mixed = ((h ^ seed) * seed) & self.MASK64
+            yield row * width + ((mixed >> 32) & (width - 1))
+
+    def increment(self, key):
+        table = self.table
+        for i in self._indexes(key):
+            if table[i] < 15:
+                table[i] += 1
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key):
+        table = self.table
+        return min(table[i] for i in self._indexes(key))
+
+    def _age(self):
+        self.table = array('B', (count >> 1 for count in self.table))
+        self.additions //= 2
+
+
+class TinyLFUCache:
+    """
+    W-TinyLFU (Einziger, Friedman & Manes). New keys land in a
+    small LRU `window`. Keys pushed out of the window only get into
+    the main segmented LRU if the frequency sketch says they are
+    used more often than the entry they would evict, so a scan of
+    one-off keys never displaces the hot set. The main area is
+    split into `probation` and `protected`; a hit in probation
+    promotes the key to protected.
+    """
+    def __init__(self, limit=10, window_ratio=0.01, protected_ratio=0.8):
+        self.limit = limit
+        self.window_limit = max(1, int(limit * window_ratio))
+        self.main_limit = max(0, limit - self.window_limit)
+        self.protected_limit = int(self.main_limit * protected_ratio)
+        self.window = RecencyQueue()
+        self.probation = RecencyQueue()
+        self.protected = RecencyQueue()
+        self.sketch = CountMinSketch(max(16, limit), 10 * max(16, limit))
+
+    def __len__(self):
+        return len(self.window) + len(self.probation) + len(self.protected)
+
+    def __contains__(self, key):
+        return (key in self.window or key in self.probation or
+                key in self.protected)
+
+    def get(self, key, default=None):
+        self.sketch.increment(key)
+        if key in self.window:
+            self.window.touch(key)
+            return self.window.get(key)
+        if key in self.protected:
+            self.protected.touch(key)
+            return self.protected.get(key)
+        if key in self.probation:
+            value = self.probation.remove(key)
+            self._protect(key, value)
+            return value
+        return default
+
+    def set(self, key, value):
+        if key in self.window:
+            self.window.update(key, value)
+            return
+        if key in self.protected:
+            self.protected.update(key, value)
+            return
+        if key in self.probation:
+            self.probation.remove(key)
+            self._protect(key, value)
+            return
+        if self.limit <= 0:
+            return
+
+        self.sketch.increment(key)
+        self.window.push(key, value)
+        if len(self.window) > self.window_limit:
+            self._admit(*self.window.pop_oldest())
+
+    def _protect(self, key, value):
+        self.protected.push(key, value)
+        if len(self.protected) > self.protected_limit:
+            self.probation.push(*self.protected.pop_oldest())
+
+    """
+    Decides whether a key evicted from the window replaces the
+    main area's eviction victim.
+    """
+    def _admit(self, key, value):
+        if len(self.probation) + len(self.protected) < self.main_limit:
+            self.probation.push(key, value)
+            return
+        victims = self.probation if self.probation else self.protected
+        if not victims:
+            return
+        victim = victims.oldest_key()
+        if self.sketch.estimate(key) > self.sketch.estimate(victim):
+            victims.pop_oldest()
+            self.probation.push(key, value)
@@ -0,0 +1,161 @@
+import asyncio
+import threading
+import unittest
+from cached import cached
+
+
+class CachedTests(unittest.TestCase):
+    def test_sync_hits_and_misses(self):
+        calls = []
+
+        @cached(limit=2)
+        def square(x):
+            calls.append(x)
+            return x * x
+
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(square(4), 16)
+        self.assertEqual(square(5), 25)
+        self.assertEqual(square(3), 9)
+        self.assertEqual(calls, [3, 4, 5, 3])
+
+        info = square.cache_info()
+        self.assertEqual(info.hits, 1)
+        self.assertEqual(info.misses, 4)
+        self.assertEqual(info.evictions, 2)
+        self.assertEqual(info.currsize, 2)
+        self.assertEqual(info.limit, 2)
+
+        square.cache_clear()
+        self.assertEqual(square.cache_info().currsize, 0)
+
+    def test_keyword_arguments_are_part_of_the_key(self):
+        @cached()
+        def join(a, sep='-'):
+            return a + sep
+
+        self.assertEqual(join('x'), 'x-')
+        self.assertEqual(join('x', sep='+'), 'x+')
+        self.assertEqual(join.cache_info().misses, 2)
+
+    def test_exceptions_are_not_cached(self):
+        attempts = []
+
+        @cached()
+        def flaky(x):
+            attempts.append(x)
+            if len(attempts) == 1:
+                raise ValueError('boom')
+            return x
+
+        with self.assertRaises(ValueError):
+            flaky(1)
+        self.assertEqual(flaky(1), 1)
+        self.assertEqual(len(attempts), 2)
+
+    def test_sync_concurrent_misses_are_coalesced(self):
+        started = threading.Event()
+        release = threading.Event()
+        calls = []
+
+        @cached()
+        def slow(x):
+            calls.append(x)
+            started.set()
+            release.wait()
+            return x * 2
+
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(slow(21)))
+                   for _ in range(5)]
+        threads[0].start()
+        started.wait()
+        for thread in threads[1:]:
+            thread.start()
+        while slow.cache_info().coalesced < 4:
+            threading.Event().wait(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [42] * 5)
+        self.assertEqual(calls, [21])
+        info = slow.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.coalesced, 4)
+
+    def test_async_concurrent_misses_are_coalesced(self):
+        calls = []
+
+        @cached(limit=10)
+        async def fetch(x):
+            calls.append(x)
+            await asyncio.sleep(0.01)
+            return x + 1
+
+        async def main():
+            results = await asyncio.gather(*(fetch(1) for _ in range(5)))
+            results.append(await fetch(1))
+            return results
+
+        self.assertEqual(asyncio.run(main()), [2] * 6)
+        self.assertEqual(calls, [1])
+        info = fetch.cache_info()
+        self.assertEqual(info.misses, 1)
+        self.assertEqual(info.coalesced, 4)
+        self.assertEqual(info.hits, 1)
+
+    def test_async_cancelled_caller_does_not_cancel_others(self):
+        @cached()
+        async def fetch(x):
+            await asyncio.sleep(0.01)
+            return x
+
+        async def main():
+            first = asyncio.ensure_future(fetch(7))
+            second = asyncio.ensure_future(fetch(7))
+            await asyncio.sleep(0)
+            first.cancel()
+            return await second
+
+        self.assertEqual(asyncio.run(main()), 7)
+        self.assertEqual(fetch.cache_info().currsize, 1)
+
+
+    def test_async_misses_on_different_event_loops(self):
+        started = threading.Barrier(2)
+
+        @cached()
+        async def fetch(x):
+            await asyncio.sleep(0.05)
+            return x * 2
+
+        async def call():
+            # Both threads are inside their loops before either call
+            # misses, so their computations overlap.
+            await asyncio.get_running_loop().run_in_executor(
+                None, started.wait, 5)
+            return await fetch(4)
+
+        results = []
+        errors = []
+
+        def run_loop():
+            try:
+                results.append(asyncio.run(call()))
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=run_loop) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(results, [8, 8])
+        self.assertEqual(fetch.cache_info().currsize, 1)
+
+if __name__ == '__main__':
+    unittest.main()
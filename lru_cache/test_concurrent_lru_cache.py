@@ -0,0 +1,99 @@
+import threading
+import unittest
+from concurrent_lru_cache import ConcurrentLRUCache
+
+
+class ConcurrentCacheTests(unittest.TestCase):
+    def setUp(self):
+        self.cache = ConcurrentLRUCache(limit=8, segments=4)
+
+    def test_capacity_is_split_across_segments(self):
+        self.assertEqual(len(self.cache.segments), 4)
+        self.assertEqual(sum(s.limit for s in self.cache.segments), 8)
+
+        small = ConcurrentLRUCache(limit=3, segments=16)
+        self.assertEqual(len(small.segments), 3)
+
+    def test_unbounded_limit(self):
+        cache = ConcurrentLRUCache(limit=None, segments=4)
+        self.assertEqual(len(cache.segments), 4)
+        for i in range(100):
+            cache.set(i, i)
+        self.assertEqual(len(cache), 100)
+        self.assertIsNone(cache.stats()['limit'])
+
+    def test_get_default(self):
+        self.assertEqual(self.cache.get('missing', 'fallback'), 'fallback')
+        self.cache.set('present', None)
+        self.assertIsNone(self.cache.get('present', 'fallback'))
+
+    def test_insertion_and_retrieval(self):
+        self.cache.set('item1', 'a')
+        self.cache.set('item2', 'b')
+        self.cache.set('item1', 'z')
+        self.assertEqual(self.cache.get('item1'), 'z')
+        self.assertEqual(self.cache.get('item2'), 'b')
+        self.assertIsNone(self.cache.get('nonexistent'))
+        self.assertEqual(len(self.cache), 2)
+        self.assertEqual(self.cache.hits, 2)
+        self.assertEqual(self.cache.misses, 1)
+
+        stats = self.cache.stats()
+        self.assertEqual(stats['inserts'], 2)
+        self.assertEqual(stats['overwrites'], 1)
+        self.assertEqual(stats['size'], 2)
+        self.assertEqual(stats['segments'], 4)
+
+    def test_global_capacity_is_respected(self):
+        for i in range(100):
+            self.cache.set(i, i)
+        self.assertLessEqual(len(self.cache), 8)
+        for segment in self.cache.segments:
+            self.assertEqual(len(segment), segment.limit)
+
+    def test_ttl_and_reap(self):
+        clock = [0.0]
+        cache = ConcurrentLRUCache(limit=40, segments=4, ttl=5)
+        for segment in cache.segments:
+            segment.clock = lambda: clock[0]
+        for i in range(6):
+            cache.set(i, i)
+        cache.set('long', 'x', ttl=50)
+
+        clock[0] = 10
+        self.assertIsNone(cache.get(0))
+        self.assertEqual(cache.misses, 1)
+        self.assertEqual(cache.reap(), 5)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(cache.get('long'), 'x')
+
+    def test_concurrent_access(self):
+        cache = ConcurrentLRUCache(limit=64, segments=8)
+        # Assertions in a worker thread only print, so collect bad
+        # reads and check them here.
+        bad_reads = []
+
+        def worker(offset):
+            for i in range(500):
+                key = (offset + i) % 100
+                cache.set(key, key * 2)
+                value = cache.get(key)
+                if not (value is None or value == key * 2):
+                    bad_reads.append((key, value))
+
+        threads = [threading.Thread(target=worker, args=(n * 7,))
+                   for n in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(bad_reads, [])
+        self.assertLessEqual(len(cache), 64)
+        self.assertEqual(cache.hits + cache.misses, 8 * 500)
+        for segment in cache.segments:
+            self.assertEqual(len(segment.order), len(segment.storage))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,16 @@
+import os
+import tempfile
+import threading
 import unittest
-from lru_cache import LRUCache
+from lru_cache import LRUCache, Reaper
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
 
 
 class CacheTests(unittest.TestCase):
@@ -32,6 +43,225 @@ class CacheTests(unittest.TestCase):
     def test_cache_nonexistent_retrieval(self):
         self.assertIsNone(self.cache.get('nonexistent'))
 
+    def test_weighted_eviction(self):
+        cache = LRUCache(limit=None, max_weight=10,
+                         weigher=lambda key, value: len(value))
+        cache.set('a', 'xxxx')
+        cache.set('b', 'xxxx')
+        self.assertEqual(cache.total_weight, 8)
+
+        cache.get('a')
+        cache.set('c', 'xxx')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 'xxxx')
+        self.assertEqual(cache.get('c'), 'xxx')
+        self.assertEqual(cache.total_weight, 7)
+
+        cache.set('a', 'x')
+        self.assertEqual(cache.total_weight, 4)
+        self.assertEqual(len(cache), 2)
+
+    def test_weighted_entry_too_heavy_to_fit(self):
+        cache = LRUCache(limit=None, max_weight=5,
+                         weigher=lambda key, value: len(value))
+        cache.set('a', 'xx')
+        cache.set('b', 'xxxxxx')
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('a'), 'xx')
+        self.assertEqual(cache.total_weight, 2)
+
+    def test_too_heavy_overwrite_reports_the_dropped_entry(self):
+        evicted = []
+        cache = LRUCache(limit=None, max_weight=5,
+                         weigher=lambda key, value: len(value),
+                         on_evict=lambda *args: evicted.append(args))
+        cache.set('a', 'xx')
+        cache.set('a', 'x' * 7)
+        self.assertNotIn('a', cache)
+        self.assertEqual(cache.total_weight, 0)
+        self.assertEqual(evicted, [('a', 'xx', 'evicted')])
+        self.assertEqual(cache.evictions, 1)
+
+    def test_ttl_expiry_is_a_miss(self):
+        clock = FakeClock()
+        cache = LRUCache(3, ttl=10, clock=clock)
+        cache.set('item1', 'a')
+        cache.set('item2', 'b', ttl=30)
+
+        clock.now = 5
+        self.assertEqual(cache.get('item1'), 'a')
+        clock.now = 10
+        self.assertIsNone(cache.get('item1'))
+        self.assertNotIn('item1', cache.storage)
+        self.assertEqual(cache.get('item2'), 'b')
+        self.assertEqual(len(cache), 1)
+
+    def test_overwrite_refreshes_ttl(self):
+        clock = FakeClock()
+        cache = LRUCache(3, ttl=10, clock=clock)
+        cache.set('item1', 'a')
+        clock.now = 8
+        cache.set('item1', 'b')
+        clock.now = 15
+        self.assertEqual(cache.reap(), 0)
+        self.assertEqual(cache.get('item1'), 'b')
+
+    def test_reap_respects_budget(self):
+        clock = FakeClock()
+        cache = LRUCache(10, clock=clock)
+        for i in range(5):
+            cache.set(i, i, ttl=i + 1)
+        cache.set('forever', 'x')
+
+        clock.now = 4
+        self.assertEqual(cache.reap(budget=2), 2)
+        self.assertEqual(cache.reap(), 2)
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.get(4), 4)
+        self.assertEqual(cache.get('forever'), 'x')
+
+    def test_background_reaper(self):
+        clock = FakeClock()
+        cache = LRUCache(10, ttl=1, clock=clock)
+        cache.set('item1', 'a')
+        clock.now = 2
+
+        lock = threading.Lock()
+        reaper = Reaper(cache, interval=0.01, lock=lock)
+        reaper.start()
+        try:
+            for _ in range(200):
+                with lock:
+                    if not cache.storage:
+                        break
+                threading.Event().wait(0.01)
+        finally:
+            reaper.stop()
+        self.assertEqual(len(cache), 0)
+
+    def test_dump_and_load_preserve_recency_order(self):
+        self.cache.set('item1', 'a')
+        self.cache.set('item2', {'b': [1, 2]})
+        self.cache.set('item3', 'c')
+        self.cache.get('item1')
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'cache.snap')
+            self.cache.dump(path)
+            restored = LRUCache(3)
+            self.assertEqual(restored.load(path), 3)
+
+        self.assertEqual([entry[0] for entry in restored.order],
+                         ['item2', 'item3', 'item1'])
+        self.assertEqual(restored.get('item2'), {'b': [1, 2]})
+        restored.set('item4', 'd')
+        self.assertIsNone(restored.get('item3'))
+
+    def test_dump_keeps_remaining_ttl(self):
+        clock = FakeClock()
+        cache = LRUCache(3, clock=clock)
+        cache.set('short', 'a', ttl=5)
+        cache.set('long', 'b', ttl=50)
+        cache.set('forever', 'c')
+        clock.now = 10
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'cache.snap')
+            cache.dump(path)
+            restored_clock = FakeClock()
+            restored = LRUCache(3, clock=restored_clock)
+            self.assertEqual(restored.load(path), 2)
+
+        restored_clock.now = 39
+        self.assertEqual(restored.get('long'), 'b')
+        restored_clock.now = 40
+        self.assertIsNone(restored.get('long'))
+        self.assertEqual(restored.get('forever'), 'c')
+
+    def test_load_keeps_entries_without_expiry_forever(self):
+        clock = FakeClock()
+        cache = LRUCache(3, clock=clock)
+        cache.set('forever', 'c')
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'cache.snap')
+            cache.dump(path)
+            restored = LRUCache(3, ttl=5, clock=clock)
+            restored.load(path)
+        clock.now = 10
+        self.assertEqual(restored.get('forever'), 'c')
+        self.assertEqual(restored.inserts, 0)
+        self.assertEqual(restored.overwrites, 0)
+
+    def test_failed_dump_leaves_no_files(self):
+        self.cache.set('item1', 'a')
+        self.cache.set('item2', lambda: None)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'cache.snap')
+            with self.assertRaises(Exception):
+                self.cache.dump(path)
+            self.assertEqual(os.listdir(tmp), [])
+
+    def test_load_rejects_other_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'junk')
+            with open(path, 'wb') as junk:
+                junk.write(b'not a snapshot at all')
+            with self.assertRaises(ValueError):
+                self.cache.load(path)
+
+    def test_counters_and_stats(self):
+        self.cache.set('item1', 'a')
+        self.cache.set('item2', 'b')
+        self.cache.set('item1', 'z')
+        self.cache.set('item3', 'c')
+        self.cache.set('item4', 'd')
+        self.cache.get('item1')
+        self.cache.get('item2')
+
+        stats = self.cache.stats()
+        self.assertEqual(stats['hits'], 1)
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['hit_rate'], 0.5)
+        self.assertEqual(stats['inserts'], 4)
+        self.assertEqual(stats['overwrites'], 1)
+        self.assertEqual(stats['evictions'], 1)
+        self.assertEqual(stats['size'], 3)
+        self.assertNotIn('get_latency', stats)
+
+    def test_eviction_listener(self):
+        clock = FakeClock()
+        evicted = []
+        cache = LRUCache(2, clock=clock,
+                         on_evict=lambda *args: evicted.append(args))
+        cache.set('item1', 'a')
+        cache.set('item2', 'b', ttl=1)
+        cache.set('item3', 'c')
+        clock.now = 5
+        cache.get('item2')
+        cache.remove('item3')
+        self.assertEqual(evicted, [('item1', 'a', 'evicted'),
+                                   ('item2', 'b', 'expired')])
+        self.assertEqual(cache.stats()['expirations'], 1)
+
+    def test_latency_histograms(self):
+        cache = LRUCache(3, record_latency=True)
+        cache.set('item1', 'a')
+        self.assertEqual(cache.get('item1'), 'a')
+        cache.get('nonexistent')
+
+        stats = cache.stats()
+        self.assertEqual(stats['get_latency']['count'], 2)
+        self.assertEqual(stats['set_latency']['count'], 1)
+        self.assertEqual(sum(stats['get_latency']['buckets'].values()), 2)
+        self.assertGreater(stats['get_latency']['p99_ns'], 0)
+
+    def test_remove(self):
+        self.cache.set('item1', 'a')
+        self.assertTrue(self.cache.remove('item1'))
+        self.assertFalse(self.cache.remove('item1'))
+        self.assertIsNone(self.cache.get('item1'))
+        self.assertEqual(len(self.cache), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,119 @@
+import unittest
+from lru_cache import LRUCache
+from scan_resistant_cache import (ARCCache, CountMinSketch, TinyLFUCache,
+                                  TwoQueueCache)
+
+
+class SharedInterfaceTests:
+    """Runs LRUCache's basic behaviour against every policy."""
+    cache_class = None
+
+    def setUp(self):
+        self.cache = self.cache_class(3)
+
+    def test_cache_overwrite_appropriately(self):
+        self.cache.set('item1', 'a')
+        self.cache.set('item2', 'b')
+        self.cache.set('item3', 'c')
+        self.cache.set('item2', 'z')
+        self.assertEqual(self.cache.get('item2'), 'z')
+
+    def test_cache_nonexistent_retrieval(self):
+        self.assertIsNone(self.cache.get('nonexistent'))
+        self.assertEqual(self.cache.get('nonexistent', 'd'), 'd')
+
+    def test_limit_is_respected(self):
+        for i in range(50):
+            self.cache.set(i, i)
+            self.cache.get(i // 2)
+            self.assertLessEqual(len(self.cache), 3)
+
+    def test_zero_limit_caches_nothing(self):
+        cache = self.cache_class(0)
+        for i in range(5):
+            cache.set(i, i)
+        self.assertEqual(len(cache), 0)
+        self.assertIsNone(cache.get(0))
+
+    def test_hot_set_survives_scan(self):
+        cache = self.cache_class(50)
+        hot = list(range(10))
+        for _ in range(5):
+            for key in hot:
+                if cache.get(key) is None:
+                    cache.set(key, key)
+        for key in range(1000, 1200):
+            if cache.get(key) is None:
+                cache.set(key, key)
+        survivors = sum(1 for key in hot if key in cache)
+        self.assertGreaterEqual(survivors, 5)
+
+
+class TwoQueueCacheTests(SharedInterfaceTests, unittest.TestCase):
+    cache_class = TwoQueueCache
+
+    def test_hot_set_survives_scan(self):
+        # 2Q only promotes keys that come back after being ghosted.
+        cache = TwoQueueCache(50)
+        for key in range(60):
+            cache.set(key, key)
+        for key in range(10):
+            self.assertIn(key, cache.ghosts)
+            cache.set(key, key)
+        for key in range(1000, 1200):
+            cache.set(key, key)
+        survivors = sum(1 for key in range(10) if key in cache)
+        self.assertEqual(survivors, 10)
+
+
+class ARCCacheTests(SharedInterfaceTests, unittest.TestCase):
+    cache_class = ARCCache
+
+    def test_ghost_hit_adapts_target(self):
+        cache = ARCCache(2)
+        cache.set('a', 1)
+        cache.set('b', 2)
+        cache.get('a')
+        cache.set('c', 3)
+        self.assertIn('b', cache.b1)
+        cache.set('b', 2)
+        self.assertEqual(cache.p, 1)
+        self.assertIn('b', cache.t2)
+        self.assertEqual(len(cache), 2)
+
+
+class TinyLFUCacheTests(SharedInterfaceTests, unittest.TestCase):
+    cache_class = TinyLFUCache
+
+
+class LRUBaselineTests(unittest.TestCase):
+    def test_lru_is_flushed_by_scan(self):
+        cache = LRUCache(50)
+        for key in range(10):
+            cache.set(key, key)
+        for key in range(1000, 1200):
+            cache.set(key, key)
+        self.assertFalse(any(key in cache for key in range(10)))
+
+
+class CountMinSketchTests(unittest.TestCase):
+    def test_estimates_and_aging(self):
+        sketch = CountMinSketch(64, 1000)
+        for _ in range(6):
+            sketch.increment('hot')
+        sketch.increment('cold')
+        self.assertGreaterEqual(sketch.estimate('hot'), 6)
+        self.assertLess(sketch.estimate('cold'), sketch.estimate('hot'))
+
+        sketch._age()
+        self.assertGreaterEqual(sketch.estimate('hot'), 3)
+
+    def test_counters_saturate(self):
+        sketch = CountMinSketch(16, 1000)
+        for _ in range(40):
+            sketch.increment('key')
+        self.assertEqual(sketch.estimate('key'), 15)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,190 @@
+import asyncio
+from abc import ABC, abstractmethod
+
+from dll_queue import BACKENDS
+from doubly_linked_list import DoublyLinkedList
+
+
+class AsyncContainer(ABC):
+    """
+    The shared machinery behind AsyncQueue and AsyncStack. Items
+    live in the same ring buffer or DLL storage as Queue and Stack.
+    Coroutines waiting for an item or for room wait on futures
+    kept in DoublyLinkedLists, one for getters and one for putters,
+    so a cancelled waiter can unlink itself in O(1). Each entry is
+    a (future, batch) pair, where `batch` marks a getter collecting
+    a batch. `maxsize` of
+    0 means the container is unbounded. Subclasses implement
+    `_take` to say which end items leave from.
+    """
+    def __init__(self, maxsize=0, backend='ring'):
+        self.maxsize = maxsize
+        self.size = 0
+        self.storage = BACKENDS[backend]()
+        self.getters = DoublyLinkedList()
+        self.putters = DoublyLinkedList()
+
+    def len(self):
+        return self.size
+
+    def full(self):
+        return 0 < self.maxsize <= self.size
+
+    """
+    Wakes the longest-waiting coroutine in `waiters` that is
+    still waiting, skipping batch getters if `plain_only` is set.
+    """
+    def _wake_next(self, waiters, plain_only=False):
+        node = waiters.head
+        while node is not None:
+            future, batch = node.value
+            if not future.done() and not (plain_only and batch):
+                waiters.delete(node)
+                future.set_result(None)
+                return
+            node = node.next
+
+    """
+    Parks the calling coroutine until it is woken from `waiters`.
+    If it is cancelled after being woken, the wakeup is passed on
+    so no item or free slot goes unclaimed.
+    """
+    async def _wait(self, waiters, batch=False):
+        future = asyncio.get_running_loop().create_future()
+        waiters.add_to_tail((future, batch))
+        node = waiters.tail
+        try:
+            await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                self._wake_next(waiters)
+            else:
+                future.cancel()
+                waiters.delete(node)
+            raise
+
+    def _put(self, value):
+        self.storage.add_to_tail(value)
+        self.size += 1
+        self._wake_next(self.getters)
+
+    """
+    Removes and returns the next item from `storage`.
+    """
+    @abstractmethod
+    def _take(self):
+        pass
+
+    def _take_one(self):
+        self.size -= 1
+        value = self._take()
+        self._wake_next(self.putters)
+        return value
+
+    async def _put_waiting(self, value):
+        while self.full():
+            await self._wait(self.putters)
+        self._put(value)
+
+    async def _take_waiting(self):
+        while self.size == 0:
+            await self._wait(self.getters)
+        return self._take_one()
+
+    def _put_nowait(self, value):
+        if self.full():
+            return False
+        self._put(value)
+        return True
+
+    def _take_nowait(self, default):
+        if self.size == 0:
+            return default
+        return self._take_one()
+
+    """
+    Collects up to `n` items. Returns as soon as `n` are available
+    or `timeout` seconds have passed, with whatever is there by
+    then, which may be nothing. With no timeout it waits for at
+    least one item and then takes up to `n` without waiting more.
+    """
+    async def _take_batch(self, n, timeout):
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while self.size < n:
+            if deadline is None:
+                if self.size > 0:
+                    break
+                await self._wait(self.getters, batch=True)
+            else:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    await asyncio.wait_for(
+                        self._wait(self.getters, batch=True), remaining)
+                except asyncio.TimeoutError:
+                    break
+            if self.size < n:
+                # This coroutine is holding out for a full batch, so
+                # let a plain getter have the item that just arrived.
+                # Other batch getters want more than one item too, so
+                # waking them would only bounce the wakeup between
+                # batch getters until their deadlines.
+                self._wake_next(self.getters, plain_only=True)
+        return [self._take_one() for _ in range(min(n, self.size))]
+
+
+class AsyncQueue(AsyncContainer):
+    """
+    An asyncio-native FIFO queue. `await enqueue` waits for room
+    when the queue is at `maxsize` and `await dequeue` waits for
+    an item when it is empty, without blocking the event loop.
+    """
+    def _take(self):
+        return self.storage.remove_from_head()
+
+    async def enqueue(self, value):
+        await self._put_waiting(value)
+
+    async def dequeue(self):
+        return await self._take_waiting()
+
+    """
+    Adds the value if there is room. Returns whether it was added.
+    """
+    def enqueue_nowait(self, value):
+        return self._put_nowait(value)
+
+    """
+    Returns the front value, or `default` if the queue is empty.
+    """
+    def dequeue_nowait(self, default=None):
+        return self._take_nowait(default)
+
+    async def dequeue_batch(self, n, timeout=None):
+        return await self._take_batch(n, timeout)
+
+
+class AsyncStack(AsyncContainer):
+    """
+    An asyncio-native LIFO stack, with the same waiting behaviour
+    as AsyncQueue.
+    """
+    def _take(self):
+        return self.storage.remove_from_tail()
+
+    async def push(self, value):
+        await self._put_waiting(value)
+
+    async def pop(self):
+        return await self._take_waiting()
+
+    def push_nowait(self, value):
+        return self._put_nowait(value)
+
+    def pop_nowait(self, default=None):
+        return self._take_nowait(default)
+
+    async def pop_batch(self, n, timeout=None):
+        return await self._take_batch(n, timeout)
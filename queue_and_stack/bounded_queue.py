@@ -0,0 +1,121 @@
+import threading
+import time
+from queue import Empty, Full
+
+from dll_queue import BACKENDS
+
+
+class BoundedQueue:
+    """
+    A thread-safe FIFO queue that holds at most `maxsize` items.
+    Producers calling `put` block while it is full and consumers
+    calling `get` block while it is empty, so a fast producer is
+    held back instead of growing the queue without bound. Waiting
+    is done on condition variables sharing the queue's one lock.
+    The `try_` variants never block, and `get_many` drains up to
+    `max_n` items per lock round-trip.
+    """
+    def __init__(self, maxsize, backend='ring'):
+        if maxsize < 1:
+            raise ValueError('maxsize must be at least 1')
+        self.maxsize = maxsize
+        self.size = 0
+        self.storage = BACKENDS[backend]()
+        self.lock = threading.Lock()
+        self.not_empty = threading.Condition(self.lock)
+        self.not_full = threading.Condition(self.lock)
+
+    def len(self):
+        with self.lock:
+            return self.size
+
+    """
+    Waits on `condition` until `ready()` is true. Returns False if
+    `timeout` seconds pass first. Must be called with the lock held.
+    """
+    def _wait_for(self, condition, ready, timeout):
+        if timeout is None:
+            while not ready():
+                condition.wait()
+            return True
+        deadline = time.monotonic() + timeout
+        while not ready():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            condition.wait(remaining)
+        return True
+
+    def _put(self, value):
+        self.storage.add_to_tail(value)
+        self.size += 1
+        self.not_empty.notify()
+
+    def _get(self):
+        self.size -= 1
+        value = self.storage.remove_from_head()
+        self.not_full.notify()
+        return value
+
+    """
+    Adds the value to the back of the queue, waiting up to
+    `timeout` seconds (forever if None) for room. Raises
+    `queue.Full` if the queue is still full when time runs out.
+    """
+    def put(self, value, timeout=None):
+        with self.not_full:
+            if not self._wait_for(self.not_full,
+                                  lambda: self.size < self.maxsize, timeout):
+                raise Full
+            self._put(value)
+
+    """
+    Removes and returns the value at the front of the queue,
+    waiting up to `timeout` seconds (forever if None) for one.
+    Raises `queue.Empty` if the queue is still empty when time
+    runs out.
+    """
+    def get(self, timeout=None):
+        with self.not_empty:
+            if not self._wait_for(self.not_empty,
+                                  lambda: self.size > 0, timeout):
+                raise Empty
+            return self._get()
+
+    """
+    Adds the value if there is room. Returns whether it was added.
+    """
+    def try_put(self, value):
+        with self.lock:
+            if self.size >= self.maxsize:
+                return False
+            self._put(value)
+            return True
+
+    """
+    Removes and returns the front value, or returns `default` if
+    the queue is empty.
+    """
+    def try_get(self, default=None):
+        with self.lock:
+            if self.size == 0:
+                return default
+            return self._get()
+
+    """
+    Waits up to `timeout` seconds for at least one value, then
+    removes and returns as many as are available, up to `max_n`,
+    in one go. Returns an empty list if nothing arrived in time.
+    """
+    def get_many(self, max_n, timeout=None):
+        with self.not_empty:
+            if not self._wait_for(self.not_empty,
+                                  lambda: self.size > 0, timeout):
+                return []
+            count = min(max_n, self.size)
+            values = [self.storage.remove_from_head() for _ in range(count)]
+            self.size -= count
+            # Several slots may have opened up, so wake as many
+            # blocked producers.
+            self.not_full.notify(count)
+            return values
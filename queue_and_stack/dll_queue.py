@@ -1,19 +1,28 @@
 import sys
 sys.path.append('../doubly_linked_list')
 from doubly_linked_list import DoublyLinkedList
+from ring_buffer import RingBuffer
+
+BACKENDS = {'ring': RingBuffer, 'dll': DoublyLinkedList}
 
 
 class Queue:
-    def __init__(self):
+    def __init__(self, backend='ring'):
         self.size = 0
-        # Why is our DLL a good choice to store our elements?
-        # self.storage = ?
+        # Elements go in at the tail and come out at the head. Both
+        # backends do that in O(1): the ring buffer keeps them in one
+        # contiguous list, the DLL allocates a node per element.
+        self.storage = BACKENDS[backend]()
 
     def enqueue(self, value):
-        pass
+        self.storage.add_to_tail(value)
+        self.size += 1
 
     def dequeue(self):
-        pass
+        if self.size == 0:
+            return None
+        self.size -= 1
+        return self.storage.remove_from_head()
 
     def len(self):
-        pass
+        return self.size
@@ -1,18 +1,27 @@
 import sys
 sys.path.append('../doubly_linked_list')
 from doubly_linked_list import DoublyLinkedList
+from ring_buffer import RingBuffer
+
+BACKENDS = {'ring': RingBuffer, 'dll': DoublyLinkedList}
+
 
 class Stack:
-    def __init__(self):
+    def __init__(self, backend='ring'):
         self.size = 0
-        # Why is our DLL a good choice to store our elements?
-        # self.storage = ?
+        # Elements are pushed and popped at the tail, which both
+        # backends support in O(1).
+        self.storage = BACKENDS[backend]()
 
     def push(self, value):
-        pass
+        self.storage.add_to_tail(value)
+        self.size += 1
 
     def pop(self):
-        pass
+        if self.size == 0:
+            return None
+        self.size -= 1
+        return self.storage.remove_from_tail()
 
     def len(self):
-        pass
+        return self.size
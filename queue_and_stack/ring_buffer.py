@@ -0,0 +1,77 @@
+class RingBuffer:
+    """
+    A growable circular buffer over one contiguous Python list.
+    `head` is the index of the first element and the elements run
+    on from there, wrapping around to the start of the list. The
+    capacity is kept a power of two so wrapping is a bit mask. It
+    doubles when full and halves when no more than a quarter full,
+    keeping every operation amortized O(1).
+
+    Its methods are named like the DoublyLinkedList's so that Queue
+    and Stack can use either one as their storage.
+    """
+    def __init__(self, capacity=8):
+        self.min_capacity = 1
+        while self.min_capacity < capacity:
+            self.min_capacity <<= 1
+        self.storage = [None] * self.min_capacity
+        self.mask = self.min_capacity - 1
+        self.head = 0
+        self.length = 0
+
+    def __len__(self):
+        return self.length
+
+    def __iter__(self):
+        for i in range(self.length):
+            yield self.storage[(self.head + i) & self.mask]
+
+    def _resize(self, capacity):
+        storage = self.storage
+        end = self.head + self.length
+        if end <= len(storage):
+            items = storage[self.head:end]
+        else:
+            items = storage[self.head:] + storage[:end - len(storage)]
+        self.storage = items + [None] * (capacity - self.length)
+        self.mask = capacity - 1
+        self.head = 0
+
+    def _shrink_if_sparse(self):
+        capacity = len(self.storage)
+        if capacity > self.min_capacity and self.length <= capacity >> 2:
+            self._resize(capacity >> 1)
+
+    def add_to_tail(self, value):
+        if self.length == len(self.storage):
+            self._resize(len(self.storage) << 1)
+        self.storage[(self.head + self.length) & self.mask] = value
+        self.length += 1
+
+    def add_to_head(self, value):
+        if self.length == len(self.storage):
+            self._resize(len(self.storage) << 1)
+        self.head = (self.head - 1) & self.mask
+        self.storage[self.head] = value
+        self.length += 1
+
+    def remove_from_head(self):
+        if self.length == 0:
+            return None
+        value = self.storage[self.head]
+        # Drop the reference so the buffer doesn't keep it alive.
+        self.storage[self.head] = None
+        self.head = (self.head + 1) & self.mask
+        self.length -= 1
+        self._shrink_if_sparse()
+        return value
+
+    def remove_from_tail(self):
+        if self.length == 0:
+            return None
+        index = (self.head + self.length - 1) & self.mask
+        value = self.storage[index]
+        self.storage[index] = None
+        self.length -= 1
+        self._shrink_if_sparse()
+        return value
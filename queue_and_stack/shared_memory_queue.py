@@ -0,0 +1,152 @@
+import struct
+import sys
+from multiprocessing import resource_tracker, shared_memory
+
+# Native format, so packing and unpacking a counter copies the
+# aligned 8-byte word with memcpy. The standard-size '<Q' format
+# converts through a byte-at-a-time loop, which the other process
+# could observe half done.
+U64 = struct.Struct('Q')
+LENGTH = struct.Struct('<I')
+
+# The header keeps each side's counters on its own cache line so
+# the producer and consumer don't keep invalidating each other's.
+# The producer owns TAIL and WRITTEN, the consumer HEAD and READ.
+TAIL = 0
+WRITTEN = 8
+CAPACITY = 16
+HEAD = 64
+READ = 72
+HEADER_SIZE = 128
+
+
+class SharedMemoryQueue:
+    """
+    A single-producer, single-consumer FIFO queue of byte strings
+    that lives in a `multiprocessing.shared_memory` segment, so
+    two processes can hand data over without pickling it or
+    sending it through a pipe. Each record is a 4-byte length
+    followed by its bytes, written into a circular data area and
+    allowed to wrap around its end.
+
+    There are no locks. TAIL and HEAD count the bytes ever written
+    and read; only the producer advances TAIL and only the consumer
+    advances HEAD, each after it has finished with the record's
+    bytes, so each side only ever sees whole records. Exactly one
+    process may enqueue and exactly one may dequeue.
+
+    That scheme needs two things Python doesn't promise. The
+    counter stores must not tear, which in practice holds because
+    the native `U64` copy of an aligned word compiles to a single
+    8-byte store on 64-bit platforms. And the record's bytes must
+    become visible to the other process before the counter that
+    publishes them. x86-64 keeps stores in program order, so this
+    holds there, but on weakly ordered CPUs such as ARM nothing
+    here orders the data copy before the counter store, and the
+    consumer can read a record before its bytes arrive. Use a
+    locked queue such as `multiprocessing.Queue` on those.
+
+    Create the queue in one process and attach to it by `name` in
+    the other. The creator should `unlink` it once both are done.
+    Attaching doesn't register the segment with the attaching
+    process's resource tracker, so a separate program that attaches
+    and exits doesn't take the segment down with it.
+    """
+    def __init__(self, name=None, capacity=1 << 20, create=True):
+        if create:
+            self.shm = shared_memory.SharedMemory(
+                name=name, create=True, size=HEADER_SIZE + capacity)
+            self.buf = self.shm.buf
+            self.buf[:HEADER_SIZE] = bytes(HEADER_SIZE)
+            U64.pack_into(self.buf, CAPACITY, capacity)
+        elif sys.version_info >= (3, 13):
+            self.shm = shared_memory.SharedMemory(name=name, track=False)
+            self.buf = self.shm.buf
+        else:
+            self.shm = shared_memory.SharedMemory(name=name)
+            # Before 3.13 attaching always registers the segment, and
+            # the tracker unlinks registered segments when this
+            # process exits.
+            resource_tracker.unregister(self.shm._name, 'shared_memory')
+            self.buf = self.shm.buf
+        self.name = self.shm.name
+        self.capacity = U64.unpack_from(self.buf, CAPACITY)[0]
+
+    def _load(self, offset):
+        return U64.unpack_from(self.buf, offset)[0]
+
+    def _store(self, offset, value):
+        U64.pack_into(self.buf, offset, value)
+
+    def _write(self, position, data):
+        offset = position % self.capacity
+        first = min(len(data), self.capacity - offset)
+        start = HEADER_SIZE + offset
+        self.buf[start:start + first] = data[:first]
+        if first < len(data):
+            rest = len(data) - first
+            self.buf[HEADER_SIZE:HEADER_SIZE + rest] = data[first:]
+
+    def _read(self, position, length):
+        offset = position % self.capacity
+        first = min(length, self.capacity - offset)
+        start = HEADER_SIZE + offset
+        data = bytes(self.buf[start:start + first])
+        if first < length:
+            data += bytes(self.buf[HEADER_SIZE:HEADER_SIZE + length - first])
+        return data
+
+    """
+    Number of records currently in the queue. Either side may
+    call it, but while the other side is active it is only a
+    snapshot.
+    """
+    def len(self):
+        return self._load(WRITTEN) - self._load(READ)
+
+    """
+    Producer only. Appends the bytes to the queue and returns
+    True, or returns False without waiting if there isn't room.
+    """
+    def enqueue(self, data):
+        data = memoryview(data).cast('B')
+        needed = LENGTH.size + len(data)
+        if needed > self.capacity:
+            raise ValueError('record is larger than the queue capacity')
+        tail = self._load(TAIL)
+        if self.capacity - (tail - self._load(HEAD)) < needed:
+            return False
+        self._write(tail, LENGTH.pack(len(data)))
+        self._write(tail + LENGTH.size, data)
+        self._store(WRITTEN, self._load(WRITTEN) + 1)
+        # Publishing the new tail is what makes the record visible.
+        self._store(TAIL, tail + needed)
+        return True
+
+    """
+    Consumer only. Removes and returns the oldest record as bytes,
+    or returns None if the queue is empty.
+    """
+    def dequeue(self):
+        head = self._load(HEAD)
+        if head == self._load(TAIL):
+            return None
+        length = LENGTH.unpack(self._read(head, LENGTH.size))[0]
+        data = self._read(head + LENGTH.size, length)
+        self._store(READ, self._load(READ) + 1)
+        # Publishing the new head hands the space back to the producer.
+        self._store(HEAD, head + LENGTH.size + length)
+        return data
+
+    def close(self):
+        self.buf = None
+        self.shm.close()
+
+    def unlink(self):
+        if sys.version_info < (3, 13):
+            # An attach from this process, or from a multiprocessing
+            # child sharing its tracker, has dropped the creator's
+            # registration too. Restore it, which is a no-op
+            # otherwise, so unlinking's unregister has one to remove.
+            resource_tracker.register(self.shm._name, 'shared_memory')
+        self.shm.unlink()
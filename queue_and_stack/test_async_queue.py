@@ -0,0 +1,150 @@
+import asyncio
+import unittest
+from async_queue import AsyncContainer, AsyncQueue, AsyncStack
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+class AsyncQueueTests(unittest.TestCase):
+    def test_container_needs_a_take(self):
+        with self.assertRaises(TypeError):
+            AsyncContainer()
+
+    def test_dequeue_respects_order(self):
+        async def main():
+            q = AsyncQueue()
+            await q.enqueue(100)
+            await q.enqueue(101)
+            self.assertEqual(q.len(), 2)
+            return [await q.dequeue(), await q.dequeue()]
+
+        self.assertEqual(run(main()), [100, 101])
+
+    def test_dequeue_waits_for_an_item(self):
+        async def main():
+            q = AsyncQueue()
+            getter = asyncio.ensure_future(q.dequeue())
+            await asyncio.sleep(0)
+            self.assertFalse(getter.done())
+            await q.enqueue('job')
+            return await getter
+
+        self.assertEqual(run(main()), 'job')
+
+    def test_maxsize_backpressure(self):
+        async def main():
+            q = AsyncQueue(maxsize=2)
+            await q.enqueue(1)
+            await q.enqueue(2)
+            self.assertFalse(q.enqueue_nowait(3))
+            putter = asyncio.ensure_future(q.enqueue(3))
+            await asyncio.sleep(0)
+            self.assertFalse(putter.done())
+            self.assertEqual(await q.dequeue(), 1)
+            await putter
+            return [q.dequeue_nowait(), q.dequeue_nowait(), q.dequeue_nowait()]
+
+        self.assertEqual(run(main()), [2, 3, None])
+
+    def test_cancelled_waiter_is_unlinked(self):
+        async def main():
+            q = AsyncQueue()
+            first = asyncio.ensure_future(q.dequeue())
+            second = asyncio.ensure_future(q.dequeue())
+            await asyncio.sleep(0)
+            self.assertEqual(len(q.getters), 2)
+            first.cancel()
+            await asyncio.sleep(0)
+            self.assertEqual(len(q.getters), 1)
+            await q.enqueue('x')
+            return await second
+
+        self.assertEqual(run(main()), 'x')
+
+    def test_cancel_after_wakeup_passes_item_on(self):
+        async def main():
+            q = AsyncQueue()
+            first = asyncio.ensure_future(q.dequeue())
+            second = asyncio.ensure_future(q.dequeue())
+            await asyncio.sleep(0)
+            q.enqueue_nowait('x')
+            first.cancel()
+            return await asyncio.wait_for(second, 1)
+
+        self.assertEqual(run(main()), 'x')
+
+    def test_dequeue_batch(self):
+        async def main():
+            q = AsyncQueue()
+            empty = await q.dequeue_batch(3, timeout=0.01)
+
+            async def producer():
+                for i in range(5):
+                    await q.enqueue(i)
+                    await asyncio.sleep(0)
+
+            task = asyncio.ensure_future(producer())
+            full = await q.dequeue_batch(3, timeout=1)
+            await task
+            rest = await q.dequeue_batch(10)
+            return empty, full, rest
+
+        self.assertEqual(run(main()), ([], [0, 1, 2], [3, 4]))
+
+    def test_batch_waiters_do_not_wake_each_other(self):
+        async def main():
+            q = AsyncQueue()
+            wakeups = []
+            wake_next = q._wake_next
+
+            def counting_wake_next(*args, **kwargs):
+                wakeups.append(args)
+                wake_next(*args, **kwargs)
+            q._wake_next = counting_wake_next
+
+            batches = [asyncio.ensure_future(q.dequeue_batch(5, timeout=0.2))
+                       for _ in range(2)]
+            # Give both batch getters time to start waiting.
+            await asyncio.sleep(0.01)
+            q.enqueue_nowait(1)
+            await asyncio.sleep(0.01)
+            plain = asyncio.ensure_future(q.dequeue())
+            await asyncio.sleep(0.01)
+            q.enqueue_nowait(2)
+            results = await asyncio.gather(*batches, plain)
+            return results, len(wakeups)
+
+        results, wakeups = run(main())
+        self.assertEqual(sorted(map(len, results[:2])), [0, 1])
+        self.assertEqual(results[2], 1)
+        self.assertLess(wakeups, 10)
+
+
+class AsyncStackTests(unittest.TestCase):
+    def test_pop_respects_order(self):
+        async def main():
+            s = AsyncStack(backend='dll')
+            for value in (100, 101, 105):
+                await s.push(value)
+            popped = [await s.pop(), await s.pop()]
+            popped.append(s.pop_nowait())
+            popped.append(s.pop_nowait())
+            return popped
+
+        self.assertEqual(run(main()), [105, 101, 100, None])
+
+    def test_pop_batch(self):
+        async def main():
+            s = AsyncStack(maxsize=3)
+            for value in range(3):
+                await s.push(value)
+            self.assertFalse(s.push_nowait(3))
+            return await s.pop_batch(2)
+
+        self.assertEqual(run(main()), [2, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
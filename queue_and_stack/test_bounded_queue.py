@@ -0,0 +1,79 @@
+import threading
+import unittest
+from queue import Empty, Full
+from bounded_queue import BoundedQueue
+
+
+class BoundedQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.q = BoundedQueue(3)
+
+    def test_put_and_get_respect_order(self):
+        self.q.put(100)
+        self.q.put(101)
+        self.assertEqual(self.q.len(), 2)
+        self.assertEqual(self.q.get(), 100)
+        self.assertEqual(self.q.get(), 101)
+        self.assertEqual(self.q.len(), 0)
+
+    def test_timeouts(self):
+        with self.assertRaises(Empty):
+            self.q.get(timeout=0.01)
+        for i in range(3):
+            self.q.put(i)
+        with self.assertRaises(Full):
+            self.q.put(3, timeout=0.01)
+        self.assertEqual(self.q.len(), 3)
+
+    def test_try_variants_never_block(self):
+        self.assertIsNone(self.q.try_get())
+        self.assertEqual(self.q.try_get('empty'), 'empty')
+        self.assertTrue(self.q.try_put(1))
+        self.assertTrue(self.q.try_put(2))
+        self.assertTrue(self.q.try_put(3))
+        self.assertFalse(self.q.try_put(4))
+        self.assertEqual(self.q.try_get(), 1)
+
+    def test_get_many(self):
+        self.assertEqual(self.q.get_many(5, timeout=0.01), [])
+        for i in range(3):
+            self.q.put(i)
+        self.assertEqual(self.q.get_many(2), [0, 1])
+        self.assertEqual(self.q.get_many(5), [2])
+        self.assertEqual(self.q.len(), 0)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            BoundedQueue(0)
+
+    def test_producer_blocks_until_consumer_drains(self):
+        q = BoundedQueue(4, backend='dll')
+        produced = list(range(200))
+        consumed = []
+        # Assertions in a worker thread only print, so collect
+        # overfull lengths and check them here.
+        overfull = []
+
+        def producer():
+            for value in produced:
+                q.put(value)
+                if q.len() > 4:
+                    overfull.append(q.len())
+
+        def consumer():
+            while len(consumed) < len(produced):
+                consumed.extend(q.get_many(3, timeout=1))
+
+        threads = [threading.Thread(target=producer),
+                   threading.Thread(target=consumer)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+
+        self.assertEqual(overfull, [])
+        self.assertEqual(consumed, produced)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -41,6 +41,19 @@ class QueueTests(unittest.TestCase):
         self.assertIsNone(self.q.dequeue())
         self.assertEqual(self.q.len(), 0)
 
+    def test_dll_backend_respects_order(self):
+        q = Queue(backend='dll')
+        q.enqueue(100)
+        q.enqueue(101)
+        self.assertEqual(q.dequeue(), 100)
+        self.assertEqual(q.dequeue(), 101)
+        self.assertIsNone(q.dequeue())
+        self.assertEqual(q.len(), 0)
+
+    def test_unknown_backend(self):
+        with self.assertRaises(KeyError):
+            Queue(backend='array')
+
 if __name__ == '__main__':
     unittest.main()
 
@@ -0,0 +1,56 @@
+import unittest
+from ring_buffer import RingBuffer
+
+
+class RingBufferTests(unittest.TestCase):
+    def setUp(self):
+        self.buffer = RingBuffer(4)
+
+    def test_fifo_wraps_around(self):
+        for i in range(3):
+            self.buffer.add_to_tail(i)
+        self.assertEqual(self.buffer.remove_from_head(), 0)
+        self.assertEqual(self.buffer.remove_from_head(), 1)
+        for i in range(3, 6):
+            self.buffer.add_to_tail(i)
+        self.assertEqual(len(self.buffer.storage), 4)
+        self.assertEqual(list(self.buffer), [2, 3, 4, 5])
+
+    def test_grows_when_full(self):
+        self.buffer.add_to_tail(1)
+        self.buffer.remove_from_head()
+        for i in range(10):
+            self.buffer.add_to_tail(i)
+        self.assertEqual(len(self.buffer.storage), 16)
+        self.assertEqual(list(self.buffer), list(range(10)))
+
+    def test_shrinks_on_low_water(self):
+        for i in range(64):
+            self.buffer.add_to_tail(i)
+        for i in range(60):
+            self.assertEqual(self.buffer.remove_from_head(), i)
+        self.assertLessEqual(len(self.buffer.storage), 16)
+        self.assertGreaterEqual(len(self.buffer.storage), 4)
+        self.assertEqual(list(self.buffer), [60, 61, 62, 63])
+
+    def test_both_ends(self):
+        self.buffer.add_to_head(2)
+        self.buffer.add_to_head(1)
+        self.buffer.add_to_tail(3)
+        self.assertEqual(list(self.buffer), [1, 2, 3])
+        self.assertEqual(self.buffer.remove_from_tail(), 3)
+        self.assertEqual(self.buffer.remove_from_head(), 1)
+        self.assertEqual(self.buffer.remove_from_tail(), 2)
+        self.assertIsNone(self.buffer.remove_from_tail())
+        self.assertIsNone(self.buffer.remove_from_head())
+
+    def test_removed_slots_are_cleared(self):
+        self.buffer.add_to_tail('a')
+        self.buffer.add_to_tail('b')
+        self.buffer.remove_from_head()
+        self.buffer.remove_from_tail()
+        self.assertEqual(self.buffer.storage, [None] * 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
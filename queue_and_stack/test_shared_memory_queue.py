@@ -0,0 +1,103 @@
+import multiprocessing
+import os
+import subprocess
+import sys
+import time
+import unittest
+from shared_memory_queue import SharedMemoryQueue
+
+
+def produce(name, count):
+    q = SharedMemoryQueue(name, create=False)
+    for i in range(count):
+        record = str(i).encode() * (i % 7 + 1)
+        while not q.enqueue(record):
+            pass
+    q.close()
+
+
+class SharedMemoryQueueTests(unittest.TestCase):
+    def setUp(self):
+        self.q = SharedMemoryQueue(capacity=64)
+
+    def tearDown(self):
+        self.q.close()
+        self.q.unlink()
+
+    def test_empty_dequeue(self):
+        self.assertIsNone(self.q.dequeue())
+        self.assertEqual(self.q.len(), 0)
+
+    def test_dequeue_respects_order(self):
+        self.assertTrue(self.q.enqueue(b'100'))
+        self.assertTrue(self.q.enqueue(bytearray(b'101')))
+        self.assertTrue(self.q.enqueue(b''))
+        self.assertEqual(self.q.len(), 3)
+        self.assertEqual(self.q.dequeue(), b'100')
+        self.assertEqual(self.q.dequeue(), b'101')
+        self.assertEqual(self.q.dequeue(), b'')
+        self.assertIsNone(self.q.dequeue())
+
+    def test_full_queue_rejects_records(self):
+        self.assertTrue(self.q.enqueue(b'x' * 40))
+        self.assertFalse(self.q.enqueue(b'y' * 40))
+        self.assertEqual(self.q.dequeue(), b'x' * 40)
+        self.assertTrue(self.q.enqueue(b'y' * 40))
+        with self.assertRaises(ValueError):
+            self.q.enqueue(b'z' * 64)
+
+    def test_records_wrap_around(self):
+        for i in range(50):
+            record = bytes([i]) * (i % 20)
+            self.assertTrue(self.q.enqueue(record))
+            self.assertEqual(self.q.dequeue(), record)
+
+    def test_attach_by_name(self):
+        other = SharedMemoryQueue(self.q.name, create=False)
+        self.assertEqual(other.capacity, 64)
+        other.enqueue(b'hello')
+        self.assertEqual(self.q.dequeue(), b'hello')
+        other.close()
+
+    def test_attach_from_a_separate_program(self):
+        # A subprocess has its own resource tracker, unlike a
+        # multiprocessing child, so it shows whether attaching leaves
+        # the segment alive after the attacher exits.
+        script = ('from shared_memory_queue import SharedMemoryQueue\n'
+                  f'q = SharedMemoryQueue({self.q.name!r}, create=False)\n'
+                  'q.enqueue(b"hello")\n'
+                  'q.close()\n')
+        child = subprocess.run([sys.executable, '-c', script],
+                               cwd=os.path.dirname(os.path.abspath(__file__)),
+                               capture_output=True, text=True, timeout=30)
+        self.assertEqual(child.returncode, 0, child.stderr)
+        self.assertNotIn('leaked', child.stderr)
+        self.assertEqual(self.q.dequeue(), b'hello')
+        other = SharedMemoryQueue(self.q.name, create=False)
+        other.close()
+
+    def test_cross_process_handoff(self):
+        count = 500
+        producer = multiprocessing.Process(target=produce,
+                                           args=(self.q.name, count))
+        producer.start()
+        received = []
+        deadline = time.monotonic() + 30
+        while len(received) < count:
+            if time.monotonic() > deadline:
+                producer.kill()
+                self.fail(f'received only {len(received)} of {count} records')
+            record = self.q.dequeue()
+            if record is not None:
+                received.append(record)
+            elif producer.exitcode is not None and self.q.len() == 0:
+                break
+        producer.join(5)
+        self.assertEqual(producer.exitcode, 0)
+
+        expected = [str(i).encode() * (i % 7 + 1) for i in range(count)]
+        self.assertEqual(received, expected)
+
+
+if __name__ == '__main__':
+    unittest.main()
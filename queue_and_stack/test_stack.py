@@ -41,6 +41,15 @@ class QueueTests(unittest.TestCase):
         self.assertIsNone(self.s.pop())
         self.assertEqual(self.s.len(), 0)
 
+    def test_dll_backend_respects_order(self):
+        s = Stack(backend='dll')
+        s.push(100)
+        s.push(101)
+        self.assertEqual(s.pop(), 101)
+        self.assertEqual(s.pop(), 100)
+        self.assertIsNone(s.pop())
+        self.assertEqual(s.len(), 0)
+
 
 if __name__ == '__main__':
     unittest.main()
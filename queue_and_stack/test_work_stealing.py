@@ -0,0 +1,95 @@
+import threading
+import unittest
+from work_stealing import WorkStealingDeque, WorkStealingScheduler
+
+
+class WorkStealingDequeTests(unittest.TestCase):
+    def setUp(self):
+        self.deque = WorkStealingDeque()
+
+    def test_owner_pops_newest_and_thief_steals_oldest(self):
+        for value in (1, 2, 3):
+            self.deque.push(value)
+        self.assertEqual(self.deque.pop(), 3)
+        self.assertEqual(self.deque.steal(), 1)
+        self.assertEqual(len(self.deque), 1)
+        self.assertEqual(self.deque.steal(), 2)
+        self.assertIsNone(self.deque.pop())
+        self.assertIsNone(self.deque.steal())
+
+
+class WorkStealingSchedulerTests(unittest.TestCase):
+    def test_submit_returns_futures(self):
+        with WorkStealingScheduler(workers=4) as scheduler:
+            futures = [scheduler.submit(pow, i, 2) for i in range(50)]
+            self.assertEqual([f.result() for f in futures],
+                             [i * i for i in range(50)])
+
+    def test_exceptions_reach_the_future(self):
+        with WorkStealingScheduler(workers=2) as scheduler:
+            future = scheduler.submit(int, 'not a number')
+            with self.assertRaises(ValueError):
+                future.result()
+
+    def test_fork_join_recursion(self):
+        def tree_sum(scheduler, lo, hi):
+            if hi - lo <= 8:
+                return sum(range(lo, hi))
+            mid = (lo + hi) // 2
+            left = scheduler.submit(tree_sum, scheduler, lo, mid)
+            right = tree_sum(scheduler, mid, hi)
+            return scheduler.join(left) + right
+
+        with WorkStealingScheduler(workers=2) as scheduler:
+            future = scheduler.submit(tree_sum, scheduler, 0, 2000)
+            self.assertEqual(scheduler.join(future), sum(range(2000)))
+
+    def test_idle_workers_steal(self):
+        release = threading.Event()
+        children = []
+        with WorkStealingScheduler(workers=2) as scheduler:
+            def spawner():
+                # Everything lands on this worker's deque while it
+                # is stuck here, so only stealing can run it.
+                children.extend(scheduler.submit(pow, i, 2)
+                                for i in range(20))
+                release.wait(5)
+
+            future = scheduler.submit(spawner)
+            while len(children) < 20:
+                threading.Event().wait(0.001)
+            results = [child.result(timeout=5) for child in children]
+            release.set()
+            future.result()
+        self.assertEqual(results, [i * i for i in range(20)])
+        self.assertGreaterEqual(sum(scheduler.steals), 20)
+
+    def test_shutdown_drains_pending_tasks(self):
+        scheduler = WorkStealingScheduler(workers=2)
+        futures = [scheduler.submit(abs, -i) for i in range(100)]
+        scheduler.shutdown()
+        self.assertTrue(all(f.done() for f in futures))
+        with self.assertRaises(RuntimeError):
+            scheduler.submit(abs, 1)
+
+
+    def test_shutdown_during_submit_still_runs_the_task(self):
+        scheduler = WorkStealingScheduler(workers=2)
+        first = scheduler.deques[0]
+        push = first.push
+
+        def push_while_shutting_down(item):
+            # Start shutting down in the middle of submit, and give
+            # it every chance to finish before the push goes ahead.
+            stopper = threading.Thread(target=scheduler.shutdown)
+            stopper.start()
+            stopper.join(0.2)
+            push(item)
+
+        first.push = push_while_shutting_down
+        future = scheduler.submit(abs, -3)
+        scheduler.shutdown()
+        self.assertEqual(future.result(timeout=5), 3)
+
+if __name__ == '__main__':
+    unittest.main()
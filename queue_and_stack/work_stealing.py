@@ -0,0 +1,191 @@
+import itertools
+import os
+import random
+import sys
+import threading
+from concurrent.futures import Future
+
+sys.path.append('../doubly_linked_list')
+from doubly_linked_list import DoublyLinkedList
+
+
+class WorkStealingDeque:
+    """
+    A double-ended work queue over a DoublyLinkedList. Its owner
+    pushes and pops at the tail, so it works on its newest (and
+    usually cache-warm) task first, while other workers steal from
+    the head, taking the oldest task, which in divide-and-conquer
+    work tends to be the biggest. A short lock guards each end
+    operation; everything it protects is O(1).
+    """
+    def __init__(self):
+        self.storage = DoublyLinkedList()
+        self.lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.storage)
+
+    def push(self, item):
+        with self.lock:
+            self.storage.add_to_tail(item)
+
+    """
+    Owner only. Removes and returns the newest item, or None.
+    """
+    def pop(self):
+        with self.lock:
+            return self.storage.remove_from_tail()
+
+    """
+    Removes and returns the oldest item, or None.
+    """
+    def steal(self):
+        with self.lock:
+            return self.storage.remove_from_head()
+
+
+class WorkStealingScheduler:
+    """
+    A thread pool with one WorkStealingDeque per worker. Tasks
+    submitted from inside a worker go onto that worker's own
+    deque; tasks submitted from outside are dealt round-robin.
+    A worker whose deque is empty steals from the others, so load
+    balances itself without one shared queue for every worker to
+    contend on.
+
+    Claiming a task only takes the lock of the deque it comes
+    from. The shared `condition` is for sleeping and waking: a
+    worker takes it only after a scan of every deque came up empty,
+    and then sleeps until `submitted`, the count of tasks ever
+    submitted, moves past the value it read before that scan.
+    `submit` takes it briefly, so the shutdown check, the push and
+    the count happen together.
+    """
+    def __init__(self, workers=None):
+        workers = workers or os.cpu_count() or 1
+        self.deques = [WorkStealingDeque() for _ in range(workers)]
+        self.steals = [0] * workers
+        self.local = threading.local()
+        self.condition = threading.Condition()
+        self.submitted = 0
+        self.shutting_down = False
+        self.round_robin = itertools.count()
+        self.threads = [threading.Thread(target=self._run, args=(i,),
+                                         daemon=True)
+                        for i in range(workers)]
+        for thread in self.threads:
+            thread.start()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.shutdown()
+
+    """
+    Schedules `fn(*args, **kwargs)` and returns a
+    `concurrent.futures.Future` for its result.
+    """
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        index = getattr(self.local, 'index', None)
+        if index is None:
+            index = next(self.round_robin) % len(self.deques)
+        with self.condition:
+            # Checked under the lock, so a task is either refused or
+            # pushed before shutdown's workers can see an empty pool.
+            if self.shutting_down:
+                raise RuntimeError('cannot submit after shutdown')
+            self.deques[index].push((future, fn, args, kwargs))
+            self.submitted += 1
+            self.condition.notify()
+        return future
+
+    """
+    Waits for the future and returns its result. Called from
+    inside a task, the worker keeps running other tasks while it
+    waits instead of blocking, so tasks can fork subtasks and join
+    them without running the pool out of threads.
+    """
+    def join(self, future):
+        index = getattr(self.local, 'index', None)
+        if index is None:
+            return future.result()
+        future.add_done_callback(self._wake_all)
+        while not future.done():
+            seen = self.submitted
+            task = self._take(index)
+            if task is not None:
+                self._execute(task)
+                continue
+            with self.condition:
+                while self.submitted == seen and not future.done():
+                    self.condition.wait()
+        return future.result()
+
+    """
+    Lets the workers finish every task already submitted, then
+    stops them.
+    """
+    def shutdown(self, wait=True):
+        with self.condition:
+            self.shutting_down = True
+            self.condition.notify_all()
+        if wait:
+            for thread in self.threads:
+                thread.join()
+
+    def _wake_all(self, _future):
+        with self.condition:
+            self.condition.notify_all()
+
+    """
+    Returns a task for this worker, or None if one scan found none:
+    its own newest task if it has one, otherwise the oldest task of
+    another worker, starting from a random victim.
+    """
+    def _take(self, index):
+        deques = self.deques
+        task = deques[index].pop()
+        if task is not None:
+            return task
+        start = random.randrange(len(deques))
+        for offset in range(len(deques)):
+            victim = (start + offset) % len(deques)
+            if victim == index:
+                continue
+            task = deques[victim].steal()
+            if task is not None:
+                self.steals[index] += 1
+                return task
+        return None
+
+    def _execute(self, task):
+        future, fn, args, kwargs = task
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as error:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    """
+    A worker exits once shutdown has begun and a scan that started
+    after the last submit found nothing. Any task pushed before
+    that scan has been claimed by then, and no more can be pushed.
+    """
+    def _run(self, index):
+        self.local.index = index
+        while True:
+            seen = self.submitted
+            task = self._take(index)
+            if task is not None:
+                self._execute(task)
+                continue
+            with self.condition:
+                while self.submitted == seen:
+                    if self.shutting_down:
+                        return
+                    self.condition.wait()